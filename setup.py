@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # Read the contents of README.md for long description
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -13,7 +13,18 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/Elie-A/QANexusPY'",
-    packages=find_packages(), 
+    packages=[
+        "src",
+        "src.qaNexusAssertion",
+        "src.qaNexusAssertion.statictVariables",
+        "src.qaNexusAssertion.utils",
+        "src.qaNexusDataGeneration",
+        "src.qaNexusDataGeneration.enums",
+        "src.qaNexusDataGeneration.model",
+        "src.qaNexusDataGeneration.statictVariables",
+        "src.qaNexusDataGeneration.utils",
+        "tests",
+    ],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -23,5 +34,6 @@ setup(
     install_requires=["numpy"],  
     extras_require={
         "dev": ["pytest"],
+        "fast": ["numba"],
     },
 )
\ No newline at end of file
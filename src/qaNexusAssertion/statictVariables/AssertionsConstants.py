@@ -1,3 +1,7 @@
+import os
+import sys
+
+
 class Constants:
     """
     Contains console color codes used for formatting text output in the QA Nexus Assertion application.
@@ -11,3 +15,16 @@ class Constants:
 
     # ANSI escape code for setting console text color to red.
     RED_CONSOLE_COLOR = "\033[31m"
+
+    # Whether assertion messages are colored.
+    # Colors are only emitted when stderr is an interactive terminal and NO_COLOR is not set,
+    # so piped output and CI logs do not carry raw escape codes.
+    USE_CONSOLE_COLOR = sys.stderr is not None and sys.stderr.isatty() and os.environ.get("NO_COLOR") is None
+
+    # Prefix and suffix wrapped around assertion messages, empty when colors are disabled.
+    MESSAGE_PREFIX = RED_CONSOLE_COLOR if USE_CONSOLE_COLOR else ""
+    MESSAGE_SUFFIX = DEFAULT_CONSOLE_COLOR if USE_CONSOLE_COLOR else ""
+
+    # Whether the assert_* helpers become no-ops when Python runs with -O.
+    # Off unless QANEXUS_DISABLE_ASSERTIONS=1 is set, so optimized runs keep checking by default.
+    DISABLE_ASSERTIONS_WHEN_OPTIMIZED = os.environ.get("QANEXUS_DISABLE_ASSERTIONS") == "1"
@@ -7,13 +7,16 @@ class AssertionException(Exception):
     The exception message will be formatted with a predefined color specified in Constants.
     """
 
-    def __init__(message):
+    def __init__(self, message):
         """
         Constructs a new AssertionException with the specified detail message.
-        The message is prefixed and suffixed with color codes from Constants
-        to highlight the error in the console output.
+        When console colors are enabled, the message is prefixed and suffixed with
+        color codes from Constants to highlight the error in the console output.
         
         :param message: The detail message to be used for this exception. This message is formatted with color codes.
         """
         # Calls the base class (Exception) constructor with the formatted message
-        super().__init__(f"{Constants.RED_CONSOLE_COLOR}{message}{Constants.DEFAULT_CONSOLE_COLOR}")
\ No newline at end of file
+        if Constants.USE_CONSOLE_COLOR:
+            super().__init__(f"{Constants.MESSAGE_PREFIX}{message}{Constants.MESSAGE_SUFFIX}")
+        else:
+            super().__init__(message)
\ No newline at end of file
@@ -1,10 +1,151 @@
+"""
+Assertion helpers for QA Nexus.
+
+Every assert_* function raises AssertionException when its check fails. The checks run
+even when Python is started with -O, unlike the builtin assert statement. To turn them
+into no-ops in an optimized run, set the environment variable QANEXUS_DISABLE_ASSERTIONS=1
+and start Python with -O. Every assert_* call then does nothing, including helpers such as
+assert_function_returns, which will not even call the function under test.
+"""
 import re
 import datetime
+from functools import lru_cache
+from math import isclose
 from typing import Callable, Collection, Dict, List, Type, TypeVar, Any, Union
 from qaNexusAssertion.utils.assertion_exception import AssertionException
+from qaNexusAssertion.statictVariables.AssertionsConstants import Constants
 
 T = TypeVar('T')  # Define the TypeVar for generic type usage
 
+# Assertion messages may be given as a zero-argument callable, which is only invoked when the assertion fails
+Message = Union[str, Callable[[], str]]
+
+_NUMBER_TYPES = (int, float, complex)  # Types accepted as numbers by assert_is_number
+_EMPTY_CHECK_TYPES = (dict, list, str)  # Types checked by assert_object_is_empty / assert_object_is_not_empty
+_CONCRETE_COLLECTIONS = (list, tuple, set, frozenset, dict, str, bytes)  # Checked before the slower Collection ABC
+_MISSING = object()  # Sentinel for absent keys/attributes, distinct from a stored None
+
+# Failure message templates for the equality assertions, formatted only when an assertion fails
+_EQUALS_FAIL_FMT = "%s Expected: %s, but was: %s"
+_NOT_EQUALS_FAIL_FMT = "%s Expected objects to be different, but both were: %s"
+_NOT_DEEP_EQUALS_FAIL_FMT = "%s Expected objects to be different, but both were deeply equal: %s"
+
+_URL_RE = re.compile(r'^https?://\S+$')  # Pattern used by assert_valid_url
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9_+&*-]+(?:\.[a-zA-Z0-9_+&*-]+)*@(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,7}$')  # Pattern used by assert_valid_email
+
+def _is_collection(obj):
+    """
+    Returns whether obj is a Collection, checking common built-in types before the ABC.
+
+    :param obj: The object to check.
+    :return: True if obj is a Collection.
+    """
+    return isinstance(obj, _CONCRETE_COLLECTIONS) or isinstance(obj, Collection)
+
+def _as_set(collection):
+    """
+    Returns collection as a set, reusing it as-is when it already is a set or frozenset.
+
+    :param collection: The collection to convert.
+    :return: A set or frozenset with the collection's elements.
+    """
+    return collection if isinstance(collection, (set, frozenset)) else set(collection)
+
+def _resolve_message(message):
+    """
+    Returns the failure message, calling it first if it was given as a callable.
+
+    Lets callers pass e.g. ``lambda: f"details {compute()}"`` so that expensive
+    formatting only happens when an assertion actually fails.
+
+    :param message: The message string, or a zero-argument callable returning it.
+    :return: The message string.
+    """
+    return message() if callable(message) else message
+
+@lru_cache(maxsize=256)
+def _get_regex(pattern):
+    """
+    Returns the compiled form of a user-supplied regular expression, cached across calls.
+
+    :param pattern: The regular expression pattern (string or already compiled pattern).
+    :return: The compiled pattern.
+    """
+    return re.compile(pattern)
+
+# Regex equivalents of the numeric strptime directives, matching the patterns _strptime itself uses.
+# Formats built only from these are parsed by assert_date_format without going through strptime.
+_DATE_DIRECTIVE_PATTERNS = {
+    'd': r'(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'y': r'(?P<y>\d\d)',
+    'Y': r'(?P<Y>\d\d\d\d)',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+    '%': '%',
+}
+
+@lru_cache(maxsize=128)
+def _compile_date_format(format):
+    """
+    Translates a strptime format into a compiled regex with one named group per directive.
+
+    :param format: The strptime format string.
+    :return: The compiled pattern, or None if the format uses a directive that is not covered
+             or repeats one; such formats are left to strptime.
+    """
+    parts = []
+    i = 0
+    while i < len(format):
+        ch = format[i]
+        if ch == '%':
+            directive = format[i + 1:i + 2]
+            if directive not in _DATE_DIRECTIVE_PATTERNS:
+                return None  # Let strptime handle the directive
+            parts.append(_DATE_DIRECTIVE_PATTERNS[directive])
+            i += 2
+        elif ch.isspace():
+            while i < len(format) and format[i].isspace():
+                i += 1
+            parts.append(r'\s+')
+        else:
+            parts.append(re.escape(ch))
+            i += 1
+    try:
+        return re.compile(''.join(parts), re.IGNORECASE)
+    except re.error:
+        return None  # Repeated directive; strptime reports it
+
+def _is_valid_date_match(found):
+    """
+    Checks that the fields captured by a _compile_date_format pattern form a real date and time.
+
+    Missing fields default the same way strptime defaults them (1900-01-01 00:00:00).
+
+    :param found: The match object returned by the compiled format pattern.
+    :return: True if the captured fields form a valid datetime.
+    """
+    fields = found.groupdict()
+    year = 1900
+    if fields.get('y') is not None:
+        year = int(fields['y'])
+        year += 2000 if year <= 68 else 1900
+    if fields.get('Y') is not None:
+        year = int(fields['Y'])
+    try:
+        datetime.datetime(
+            year,
+            int(fields.get('m') or 1),
+            int(fields.get('d') or 1),
+            int(fields.get('H') or 0),
+            int(fields.get('M') or 0),
+            int(fields.get('S') or 0),
+        )
+    except ValueError:
+        return False
+    return True
+
 def assert_is_number(obj, message):
     """
     Asserts that the given object is an instance of a number.
@@ -13,8 +154,8 @@ def assert_is_number(obj, message):
     :param message: The message to include in the exception if the assertion fails.
     :raises AssertionException: If the object is not an instance of a number.
     """
-    if not isinstance(obj, (int, float, complex)):
-        raise AssertionException(message)
+    if not isinstance(obj, _NUMBER_TYPES):
+        raise AssertionException(_resolve_message(message))
 
 def assert_is_not_number(obj, message):
     """
@@ -24,8 +165,8 @@ def assert_is_not_number(obj, message):
     :param message: The message to include in the exception if the assertion fails.
     :raises AssertionException: If the object is an instance of a number.
     """
-    if isinstance(obj, (int, float, complex)):
-        raise AssertionException(message)
+    if isinstance(obj, _NUMBER_TYPES):
+        raise AssertionException(_resolve_message(message))
     
 def assert_equals(expected, actual, message):
     """
@@ -36,10 +177,10 @@ def assert_equals(expected, actual, message):
     :param message: The message to include in the exception if the assertion fails.
     :raises AssertionException: If the objects are not equal.
     """
-    if expected is None and actual is None:
+    if expected is actual:  # Covers None/None and skips __eq__ for the same object
         return
     if expected != actual:
-        raise AssertionException(f"{message} Expected: {expected}, but was: {actual}")
+        raise AssertionException(_EQUALS_FAIL_FMT % (_resolve_message(message), expected, actual))
 
 def assert_not_equals(expected, actual, message):
     """
@@ -50,10 +191,12 @@ def assert_not_equals(expected, actual, message):
     :param message: The message to include in the exception if the assertion fails.
     :raises AssertionException: If the objects are equal.
     """
-    if expected is None and actual is None:
-        raise AssertionException(f"{message} Both objects are null, expected them to be different.")
+    if expected is actual:
+        if expected is None:
+            raise AssertionException(f"{_resolve_message(message)} Both objects are null, expected them to be different.")
+        raise AssertionException(_NOT_EQUALS_FAIL_FMT % (_resolve_message(message), actual))
     if expected == actual:
-        raise AssertionException(f"{message} Expected objects to be different, but both were: {actual}")
+        raise AssertionException(_NOT_EQUALS_FAIL_FMT % (_resolve_message(message), actual))
 
 def assert_deep_equals(expected, actual, message):
     """
@@ -64,8 +207,10 @@ def assert_deep_equals(expected, actual, message):
     :param message: The message to include in the exception if the assertion fails.
     :raises AssertionException: If the objects are not deeply equal.
     """
+    if expected is actual:
+        return
     if expected != actual:
-        raise AssertionException(f"{message} Expected: {expected}, but was: {actual}")
+        raise AssertionException(_EQUALS_FAIL_FMT % (_resolve_message(message), expected, actual))
 
 def assert_not_deep_equals(expected, actual, message):
     """
@@ -77,7 +222,7 @@ def assert_not_deep_equals(expected, actual, message):
     :raises AssertionException: If the objects are deeply equal.
     """
     if expected == actual:
-        raise AssertionException(f"{message} Expected objects to be different, but both were deeply equal: {actual}")
+        raise AssertionException(_NOT_DEEP_EQUALS_FAIL_FMT % (_resolve_message(message), actual))
 
 def assert_is_true(condition, message):
     """
@@ -88,7 +233,7 @@ def assert_is_true(condition, message):
     :raises AssertionException: If the condition is false.
     """
     if not condition:
-        raise AssertionException(message)
+        raise AssertionException(_resolve_message(message))
 
 def assert_is_false(condition, message):
     """
@@ -99,12 +244,15 @@ def assert_is_false(condition, message):
     :raises AssertionException: If the condition is true.
     """
     if condition:
-        raise AssertionException(message)
+        raise AssertionException(_resolve_message(message))
     
 def assert_throws(runnable, message):
     """
     Asserts that executing the given callable throws an exception.
 
+    Any Exception counts as success. Raising and catching is comparatively expensive,
+    so prefer assert_function_throws with a specific type when the expected exception is known.
+
     :param runnable: The callable to execute.
     :param message: The message to include in the exception if the assertion fails.
     :raises AssertionException: If no exception is thrown.
@@ -113,7 +261,7 @@ def assert_throws(runnable, message):
         runnable()
     except Exception:
         return
-    raise AssertionException(message)
+    raise AssertionException(_resolve_message(message))
 
 def assert_is_type_of(expected_type, obj, message):
     """
@@ -125,7 +273,7 @@ def assert_is_type_of(expected_type, obj, message):
     :raises AssertionException: If the object is not an instance of the expected class.
     """
     if not isinstance(obj, expected_type):
-        raise AssertionException(f"{message} Expected type: {expected_type.__name__}, but was: {type(obj).__name__}")
+        raise AssertionException(f"{_resolve_message(message)} Expected type: {expected_type.__name__}, but was: {type(obj).__name__}")
 
 def assert_in_range(value, min_value, max_value, message):
     """
@@ -138,71 +286,72 @@ def assert_in_range(value, min_value, max_value, message):
     :raises AssertionException: If the value is not within the specified range.
     """
     if not (min_value < value < max_value):
-        raise AssertionException(f"{message} Expected: {min_value} < {value} < {max_value}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {min_value} < {value} < {max_value}")
     
 def assert_not_in_range(value, min_value, max_value, message):
     """
     Asserts that a number is not within the specified range (exclusive).
     """
     if min_value < value < max_value:
-        raise AssertionException(f"{message} Expected: {value} to not be in range ({min_value}, {max_value})")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to not be in range ({min_value}, {max_value})")
 
 def assert_in_range_included(value, min_value, max_value, message):
     """
     Asserts that a number is within the specified range (inclusive).
     """
     if not (min_value <= value <= max_value):
-        raise AssertionException(f"{message} Expected: {min_value} <= {value} <= {max_value}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {min_value} <= {value} <= {max_value}")
 
 def assert_not_in_range_included(value, min_value, max_value, message):
     """
     Asserts that a number is not within the specified range (inclusive).
     """
     if min_value <= value <= max_value:
-        raise AssertionException(f"{message} Expected: {value} to not be in range [{min_value}, {max_value}]")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to not be in range [{min_value}, {max_value}]")
 
 def assert_collection_contains(collection, element, message):
     """
     Asserts that a collection contains the specified element.
     """
     if element not in collection:
-        raise AssertionException(f"{message} Collection does not contain: {element}")
+        raise AssertionException(f"{_resolve_message(message)} Collection does not contain: {element}")
 
 def assert_subset_of(subset, superset, message):
     """
     Asserts that the first collection is a subset of the second collection.
     """
-    if not set(subset).issubset(superset):
-        raise AssertionException(f"{message} Expected subset, but was not found")
+    if not _as_set(subset).issubset(superset):
+        raise AssertionException(f"{_resolve_message(message)} Expected subset, but was not found")
 
 def assert_disjoint(collection1, collection2, message):
     """
     Asserts that two collections are disjoint (do not share any common elements).
     """
-    if set(collection1).intersection(collection2):
-        common_elements = set(collection1).intersection(collection2)
-        raise AssertionException(f"{message} Collections are not disjoint; common element(s): {common_elements}")
+    set1 = _as_set(collection1)
+    if not set1.isdisjoint(collection2):
+        common_elements = set1.intersection(collection2)
+        raise AssertionException(f"{_resolve_message(message)} Collections are not disjoint; common element(s): {common_elements}")
 
-def assert_is_null_or_undefined(obj, message):
+def assert_is_null(obj, message):
     """
-    Asserts that an object is either null or undefined (not set).
+    Asserts that an object is null.
     """
     if obj is not None:
-        raise AssertionException(message)
+        raise AssertionException(_resolve_message(message))
 
-def assert_is_null(obj, message):
+def assert_is_null_or_undefined(obj, message):
     """
-    Asserts that an object is null.
+    Asserts that an object is either null or undefined (not set).
     """
-    if obj is not None:
-        raise AssertionException(message)
+    # Python has no separate "undefined" value, so this is the same check as assert_is_null
+    assert_is_null(obj, message)
 
 def assert_is_not_null_or_undefined(obj, message):
     """
     Asserts that an object is not null.
     """
     if obj is None:
-        raise AssertionException(message)
+        raise AssertionException(_resolve_message(message))
 
 def assert_object_has_property(obj, property_name, message):
     """
@@ -210,26 +359,25 @@ def assert_object_has_property(obj, property_name, message):
     """
     if isinstance(obj, dict):
         if property_name not in obj:
-            raise AssertionException(f"{message} Object does not have property: {property_name}")
-    else:
-        if not hasattr(obj, property_name):
-            raise AssertionException(f"{message} Object does not have property: {property_name}")
+            raise AssertionException(f"{_resolve_message(message)} Object does not have property: {property_name}")
+    elif getattr(obj, property_name, _MISSING) is _MISSING:
+        raise AssertionException(f"{_resolve_message(message)} Object does not have property: {property_name}")
 
 def assert_has_property_value(obj, field_name, expected_value, message):
     """
     Asserts that an object has a specified property with a given value.
     """
     if isinstance(obj, dict):
-        actual_value = obj.get(field_name, None)
+        actual_value = obj.get(field_name, _MISSING)
     else:
-        if not hasattr(obj, field_name):
-            raise AssertionException(f"{message} Object does not have property: {field_name}")
-        actual_value = getattr(obj, field_name)
+        actual_value = getattr(obj, field_name, _MISSING)  # One lookup instead of hasattr + getattr
 
+    if actual_value is _MISSING:
+        raise AssertionException(f"{_resolve_message(message)} Object does not have property: {field_name}")
     if actual_value != expected_value:
-        raise AssertionException(f"{message} Expected value for '{field_name}' was {expected_value}, but got {actual_value}")
+        raise AssertionException(f"{_resolve_message(message)} Expected value for '{field_name}' was {expected_value}, but got {actual_value}")
     
-def assert_empty_object(obj: Union[dict, Collection, str, None], message: str):
+def assert_empty_object(obj: Union[dict, Collection, str, None], message: Message):
     """
     Asserts that an object (dict, collection, or string) is empty.
     
@@ -241,115 +389,137 @@ def assert_empty_object(obj: Union[dict, Collection, str, None], message: str):
         AssertionException: If the object is not empty.
     """
     if obj is None:
-        raise AssertionException(f"{message} Expected non-empty object, but got None.")
+        raise AssertionException(f"{_resolve_message(message)} Expected non-empty object, but got None.")
         
-    if isinstance(obj, dict) and obj:
-        raise AssertionException(f"{message} Expected empty map, but was not.")
-    elif isinstance(obj, Collection) and obj:
-        raise AssertionException(f"{message} Expected empty collection, but was not.")
-    elif isinstance(obj, str) and obj:
-        raise AssertionException(f"{message} Expected empty string, but was not.")
+    if isinstance(obj, _CONCRETE_COLLECTIONS):
+        # Fast path for built-ins, avoiding the Collection ABC instance check
+        if not obj:
+            return
+        if isinstance(obj, dict):
+            raise AssertionException(f"{_resolve_message(message)} Expected empty map, but was not.")
+        if isinstance(obj, str):
+            raise AssertionException(f"{_resolve_message(message)} Expected empty string, but was not.")
+        raise AssertionException(f"{_resolve_message(message)} Expected empty collection, but was not.")
+    if isinstance(obj, Collection) and obj:
+        raise AssertionException(f"{_resolve_message(message)} Expected empty collection, but was not.")
     
-def assert_greater_than(value: float, reference: float, message: str):
+def assert_greater_than(value: float, reference: float, message: Message):
     """
     Asserts that a number is greater than a specified reference value.
     """
     if value <= reference:
-        raise AssertionException(f"{message} Expected: {value} > {reference}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} > {reference}")
 
-def assert_greater_than_or_equal(value: float, reference: float, message: str):
+def assert_greater_than_or_equal(value: float, reference: float, message: Message):
     """
     Asserts that a number is greater than or equal to a specified reference value.
     """
     if value < reference:
-        raise AssertionException(f"{message} Expected: {value} >= {reference}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} >= {reference}")
 
-def assert_less_than(value: float, reference: float, message: str):
+def assert_less_than(value: float, reference: float, message: Message):
     """
     Asserts that a number is less than a specified reference value.
     """
     if value >= reference:
-        raise AssertionException(f"{message} Expected: {value} < {reference}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} < {reference}")
 
-def assert_less_than_or_equal(value: float, reference: float, message: str):
+def assert_less_than_or_equal(value: float, reference: float, message: Message):
     """
     Asserts that a number is less than or equal to a specified reference value.
     """
     if value > reference:
-        raise AssertionException(f"{message} Expected: {value} <= {reference}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} <= {reference}")
 
-def assert_object_has_keys(obj: Dict[Any, Any], keys: Collection[Any], message: str):
+def assert_object_has_keys(obj: Dict[Any, Any], keys: Collection[Any], message: Message):
     """
     Asserts that a dictionary has all specified keys.
     """
-    missing_keys = [key for key in keys if key not in obj]
-    if missing_keys:
-        raise AssertionException(f"{message} Object is missing key(s): {', '.join(map(str, missing_keys))}")
+    missing = set(keys).difference(obj)
+    if missing:
+        missing_keys = [key for key in keys if key in missing]  # Report in the caller's order
+        raise AssertionException(f"{_resolve_message(message)} Object is missing key(s): {', '.join(map(str, missing_keys))}")
 
-def assert_is_collection_empty(collection: Collection[Any], message: str):
+def assert_is_collection_empty(collection: Collection[Any], message: Message):
     """
     Asserts that a collection is empty.
     """
     if collection:
-        raise AssertionException(f"{message} Expected empty collection, but was not.")
+        raise AssertionException(f"{_resolve_message(message)} Expected empty collection, but was not.")
 
-def assert_collection_is_not_empty(collection: Collection[Any], message: str):
+def assert_collection_is_not_empty(collection: Collection[Any], message: Message):
     """
     Asserts that a collection is not empty.
     """
     if not collection:
-        raise AssertionException(f"{message} Expected non-empty collection, but was empty.")
+        raise AssertionException(f"{_resolve_message(message)} Expected non-empty collection, but was empty.")
 
-def assert_collection_length(collection: Collection[Any], expected_length: int, message: str):
+def assert_collection_length(collection: Collection[Any], expected_length: int, message: Message):
     """
     Asserts that a collection has a specified length.
     """
     if len(collection) != expected_length:
-        raise AssertionException(f"{message} Expected length: {expected_length}, but was: {len(collection)}")
+        raise AssertionException(f"{_resolve_message(message)} Expected length: {expected_length}, but was: {len(collection)}")
 
-def assert_string_length(string: str, expected_length: int, message: str):
+def assert_string_length(string: str, expected_length: int, message: Message):
     """
     Asserts that a string has a specified length.
     """
     if len(string) != expected_length:
-        raise AssertionException(f"{message} Expected length: {expected_length}, but was: {len(string)}")
+        raise AssertionException(f"{_resolve_message(message)} Expected length: {expected_length}, but was: {len(string)}")
 
-def assert_string_contains(string: str, substring: str, message: str):
+def assert_string_contains(string: str, substring: str, message: Message):
     """
     Asserts that a string contains a specified substring.
     """
     if substring not in string:
-        raise AssertionException(f"{message} String does not contain: {substring}")
+        raise AssertionException(f"{_resolve_message(message)} String does not contain: {substring}")
 
-def assert_string_starts_with(string: str, prefix: str, message: str):
+def assert_string_starts_with(string: str, prefix: str, message: Message):
     """
     Asserts that a string starts with a specified prefix.
     """
     if not string.startswith(prefix):
-        raise AssertionException(f"{message} String does not start with: {prefix}")
+        raise AssertionException(f"{_resolve_message(message)} String does not start with: {prefix}")
+
+def assert_string_starts_with_any(string: str, prefixes: Collection[str], message: Message):
+    """
+    Asserts that a string starts with at least one of the specified prefixes.
+
+    Args:
+        string (str): The string to check.
+        prefixes (Collection[str]): The accepted prefixes.
+        message (str | Callable[[], str]): The error message if the assertion fails.
+
+    Raises:
+        AssertionException: If the string starts with none of the prefixes.
+    """
+    prefixes = tuple(prefixes)
+    if not string.startswith(prefixes):
+        raise AssertionException(f"{_resolve_message(message)} String does not start with any of: {', '.join(map(repr, prefixes))}")
 
-def assert_string_ends_with(string: str, suffix: str, message: str):
+def assert_string_ends_with(string: str, suffix: str, message: Message):
     """
     Asserts that a string ends with a specified suffix.
     """
     if not string.endswith(suffix):
-        raise AssertionException(f"{message} String does not end with: {suffix}")
+        raise AssertionException(f"{_resolve_message(message)} String does not end with: {suffix}")
 
-def assert_string_matches_regex(string: str, regex: str, message: str):
+def assert_string_matches_regex(string: str, regex: str, message: Message):
     """
     Asserts that a string matches a specified regular expression pattern.
     """
-    if not re.fullmatch(regex, string):
-        raise AssertionException(f"{message} String does not match pattern: {regex}")
+    if not _get_regex(regex).fullmatch(string):
+        raise AssertionException(f"{_resolve_message(message)} String does not match pattern: {regex}")
 
-def assert_string_not_matches_regex(string: str, regex: str, message: str):
+def assert_string_not_matches_regex(string: str, regex: str, message: Message):
     """
     Asserts that a string does not match a specified regular expression pattern.
     """
-    if re.fullmatch(regex, string):
-        raise AssertionException(f"{message} String matches pattern: {regex}")
+    if _get_regex(regex).fullmatch(string):
+        raise AssertionException(f"{_resolve_message(message)} String matches pattern: {regex}")
 
-def assert_instance_of(expected_class: Type[Any], obj: Any, message: str):
+def assert_instance_of(expected_class: Type[Any], obj: Any, message: Message):
     """
     Asserts that an object is an instance of a specified class.
 
@@ -362,102 +532,106 @@ def assert_instance_of(expected_class: Type[Any], obj: Any, message: str):
         AssertionException: If the object is not an instance of the expected class.
     """
     if not isinstance(obj, expected_class):
-        raise AssertionException(f"{message} Object is not an instance of: {expected_class.__name__}")
+        raise AssertionException(f"{_resolve_message(message)} Object is not an instance of: {expected_class.__name__}")
     
-def assert_date(obj: object, message: str):
+def assert_date(obj: object, message: Message):
     """
     Asserts that the given object is a date.
 
     Args:
         obj (object): The object to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the object is not a date.
     """
     if not isinstance(obj, datetime.date):
-        raise AssertionException(f"{message} Object is not a Date")
+        raise AssertionException(f"{_resolve_message(message)} Object is not a Date")
 
-def assert_date_format(date: str, format: str, message: str):
+def assert_date_format(date: str, format: str, message: Message):
     """
     Asserts that the given date string matches the specified format.
 
     Args:
         date (str): The date string to check.
         format (str): The format string to compare against.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the date string does not match the format.
     """
+    # Numeric formats are parsed with a cached regex, bypassing strptime and its locked format cache
+    date_regex = _compile_date_format(format)
+    if date_regex is not None:
+        found = date_regex.fullmatch(date)
+        if found is None or not _is_valid_date_match(found):
+            raise AssertionException(f"{_resolve_message(message)} Date does not match format: {format}")
+        return
     try:
         datetime.datetime.strptime(date, format)
     except ValueError:
-        raise AssertionException(f"{message} Date does not match format: {format}")
+        raise AssertionException(f"{_resolve_message(message)} Date does not match format: {format}") from None
 
-def assert_is_function(obj: object, message: str):
+def assert_is_function(obj: object, message: Message):
     """
     Asserts that the given object is callable (i.e., a function).
 
     Args:
         obj (object): The object to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the object is not callable.
     """
     if not callable(obj):
-        raise AssertionException(f"{message} Object is not callable")
+        raise AssertionException(f"{_resolve_message(message)} Object is not callable")
 
-def assert_not_deep_include(collection: Collection, element: object, message: str):
+def assert_not_deep_include(collection: Collection, element: object, message: Message):
     """
     Asserts that the given element is not deeply included in the collection.
 
     Args:
         collection (Collection): The collection to check.
         element (object): The element to check for.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the collection deeply includes the element.
     """
     if element in collection:
-        raise AssertionException(f"{message} Collection deeply includes: {element}")
+        raise AssertionException(f"{_resolve_message(message)} Collection deeply includes: {element}")
 
-def assert_nested_include(collection: Collection, nested_element: object, message: str):
+def assert_nested_include(collection: Collection, nested_element: object, message: Message):
     """
     Asserts that the given nested element is included in the collection.
 
     Args:
         collection (Collection): The collection to check.
         nested_element (object): The nested element to check for.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the nested element is not included in the collection.
     """
-    for element in collection:
-        if isinstance(element, Collection) and nested_element in element:
-            return
-    raise AssertionException(f"{message} Collection does not include nested element: {nested_element}")
+    if not any(nested_element in element for element in collection if _is_collection(element)):
+        raise AssertionException(f"{_resolve_message(message)} Collection does not include nested element: {nested_element}")
 
-def assert_not_nested_include(collection: Collection, nested_element: object, message: str):
+def assert_not_nested_include(collection: Collection, nested_element: object, message: Message):
     """
     Asserts that the given nested element is not included in the collection.
 
     Args:
         collection (Collection): The collection to check.
         nested_element (object): The nested element to check for.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the nested element is included in the collection.
     """
-    for element in collection:
-        if isinstance(element, Collection) and nested_element in element:
-            raise AssertionException(f"{message} Collection includes nested element: {nested_element}")
+    if any(nested_element in element for element in collection if _is_collection(element)):
+        raise AssertionException(f"{_resolve_message(message)} Collection includes nested element: {nested_element}")
 
-def assert_close_to(actual: float, expected: float, delta: float, message: str):
+def assert_close_to(actual: float, expected: float, delta: float, message: Message):
     """
     Asserts that the actual value is close to the expected value within a given delta.
 
@@ -465,374 +639,384 @@ def assert_close_to(actual: float, expected: float, delta: float, message: str):
         actual (float): The actual value.
         expected (float): The expected value.
         delta (float): The acceptable delta.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the actual value is not within the delta of the expected value.
     """
-    if abs(actual - expected) > delta:
-        raise AssertionException(f"{message} Expected: {actual} to be close to: {expected} within: {delta}")
+    if isinstance(actual, complex) or isinstance(expected, complex) or delta < 0:
+        # isclose rejects complex operands and negative tolerances; compare directly instead
+        is_close = abs(actual - expected) <= delta
+    else:
+        is_close = isclose(actual, expected, rel_tol=0.0, abs_tol=delta)
+    if not is_close:  # Both forms fail on NaN, unlike abs(a - b) > delta
+        raise AssertionException(f"{_resolve_message(message)} Expected: {actual} to be close to: {expected} within: {delta}")
 
-def assert_collections_same_members(collection1: Collection, collection2: Collection, message: str):
+def assert_collections_same_members(collection1: Collection, collection2: Collection, message: Message):
     """
     Asserts that two collections have the same members.
 
     Args:
         collection1 (Collection): The first collection.
         collection2 (Collection): The second collection.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the collections do not have the same members.
     """
-    if not (set(collection1) == set(collection2)):
-        raise AssertionException(f"{message} Collections do not have the same members")
+    set1 = _as_set(collection1)
+    set2 = _as_set(collection2)
+    if set1 != set2:
+        raise AssertionException(f"{_resolve_message(message)} Collections do not have the same members")
 
-def assert_collection_not_same_members(collection1: Collection, collection2: Collection, message: str):
+def assert_collection_not_same_members(collection1: Collection, collection2: Collection, message: Message):
     """
     Asserts that two collections do not have the same members.
 
     Args:
         collection1 (Collection): The first collection.
         collection2 (Collection): The second collection.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the collections have the same members.
     """
-    if set(collection1) == set(collection2):
-        raise AssertionException(f"{message} Collections have the same members, but they should not")
+    set1 = _as_set(collection1)
+    set2 = _as_set(collection2)
+    if set1 == set2:
+        raise AssertionException(f"{_resolve_message(message)} Collections have the same members, but they should not")
 
-def assert_is_increment_of(value: int, reference: int, message: str):
+def assert_is_increment_of(value: int, reference: int, message: Message):
     """
     Asserts that the value is exactly one greater than the reference value.
 
     Args:
         value (int): The value to check.
         reference (int): The reference value.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is not an increment of the reference value.
     """
     if value != reference + 1:
-        raise AssertionException(f"{message} Expected: {value} to be increment of: {reference}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to be increment of: {reference}")
 
-def assert_not_increment_of(value: int, reference: int, message: str):
+def assert_not_increment_of(value: int, reference: int, message: Message):
     """
     Asserts that the value is not exactly one greater than the reference value.
 
     Args:
         value (int): The value to check.
         reference (int): The reference value.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is an increment of the reference value.
     """
     if value == reference + 1:
-        raise AssertionException(f"{message} Expected: {value} not to be increment of: {reference}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} not to be increment of: {reference}")
 
-def assert_is_decrement_of(value: int, reference: int, message: str):
+def assert_is_decrement_of(value: int, reference: int, message: Message):
     """
     Asserts that the value is exactly one less than the reference value.
 
     Args:
         value (int): The value to check.
         reference (int): The reference value.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is not a decrement of the reference value.
     """
     if value != reference - 1:
-        raise AssertionException(f"{message} Expected: {value} to be decrement of: {reference}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to be decrement of: {reference}")
 
-def assert_not_decrement_of(value: int, reference: int, message: str):
+def assert_not_decrement_of(value: int, reference: int, message: Message):
     """
     Asserts that the value is not exactly one less than the reference value.
 
     Args:
         value (int): The value to check.
         reference (int): The reference value.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is a decrement of the reference value.
     """
     if value == reference - 1:
-        raise AssertionException(f"{message} Expected: {value} not to be decrement of: {reference}")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} not to be decrement of: {reference}")
 
-def assert_zero(value: float, message: str):
+def assert_zero(value: float, message: Message):
     """
     Asserts that the value is zero.
 
     Args:
         value (float): The value to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is not zero.
     """
     if value != 0:
-        raise AssertionException(f"{message} Expected: {value} to be zero")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to be zero")
 
-def assert_not_zero(value: float, message: str):
+def assert_not_zero(value: float, message: Message):
     """
     Asserts that the value is not zero.
 
     Args:
         value (float): The value to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is zero.
     """
     if value == 0:
-        raise AssertionException(f"{message} Expected: {value} not to be zero")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} not to be zero")
 
-def assert_positive(value: float, message: str):
+def assert_positive(value: float, message: Message):
     """
     Asserts that the value is positive.
 
     Args:
         value (float): The value to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is not positive.
     """
     if value <= 0:
-        raise AssertionException(f"{message} Expected: {value} to be positive")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to be positive")
 
-def assert_negative(value: float, message: str):
+def assert_negative(value: float, message: Message):
     """
     Asserts that the value is negative.
 
     Args:
         value (float): The value to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is not negative.
     """
     if value >= 0:
-        raise AssertionException(f"{message} Expected: {value} to be negative")
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to be negative")
 
-def assert_odd(value: int, message: str):
+def assert_odd(value: int, message: Message):
     """
     Asserts that the value is odd.
 
     Args:
         value (int): The value to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is not odd.
     """
-    if value % 2 != 1:
-        raise AssertionException(f"{message} Expected: {value} to be odd")
+    # Bitwise AND for ints; other numbers (e.g. floats) keep the modulo semantics
+    parity = value & 1 if isinstance(value, int) else value % 2
+    if parity != 1:
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to be odd")
 
-def assert_even(value: int, message: str):
+def assert_even(value: int, message: Message):
     """
     Asserts that the value is even.
 
     Args:
         value (int): The value to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the value is not even.
     """
-    if value % 2 != 0:
-        raise AssertionException(f"{message} Expected: {value} to be even")
+    parity = value & 1 if isinstance(value, int) else value % 2
+    if parity != 0:
+        raise AssertionException(f"{_resolve_message(message)} Expected: {value} to be even")
 
-def assert_valid_url(url: str, message: str):
+def assert_valid_url(url: str, message: Message):
     """
     Asserts that the given string is a valid URL.
 
     Args:
         url (str): The URL to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the string is not a valid URL.
     """
-    if not re.match(r'^https?://\S+$', url):
-        raise AssertionException(f"{message} String is not a valid URL")
+    if not _URL_RE.match(url):
+        raise AssertionException(f"{_resolve_message(message)} String is not a valid URL")
 
-def assert_valid_email(email: str, message: str):
+def assert_valid_email(email: str, message: Message):
     """
     Asserts that the given string is a valid email address.
 
     Args:
         email (str): The email address to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the email address is not valid.
     """
-    regex = r'^[a-zA-Z0-9_+&*-]+(?:\.[a-zA-Z0-9_+&*-]+)*@(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,7}$'
-    if not re.match(regex, email):
-        raise AssertionException(f"{message} Email address is not valid")
+    if not _EMAIL_RE.match(email):
+        raise AssertionException(f"{_resolve_message(message)} Email address is not valid")
 
-def assert_is_array(obj: object, message: str):
+def assert_is_array(obj: object, message: Message):
     """
     Asserts that the given object is a list.
 
     Args:
         obj (object): The object to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the object is not a list.
     """
     if not isinstance(obj, list):
-        raise AssertionException(f"{message} Object is not a list")
+        raise AssertionException(f"{_resolve_message(message)} Object is not a list")
 
-def assert_is_not_array(obj: object, message: str):
+def assert_is_not_array(obj: object, message: Message):
     """
     Asserts that the given object is not a list.
 
     Args:
         obj (object): The object to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the object is a list.
     """
     if isinstance(obj, list):
-        raise AssertionException(f"{message} Object is a list, but should not be")
+        raise AssertionException(f"{_resolve_message(message)} Object is a list, but should not be")
 
-def assert_array_length(array: List, expected_length: int, message: str):
+def assert_array_length(array: List, expected_length: int, message: Message):
     """
     Asserts that the length of the array matches the expected length.
 
     Args:
         array (List): The list to check.
         expected_length (int): The expected length of the list.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the length of the list does not match the expected length.
     """
     if len(array) != expected_length:
-        raise AssertionException(f"{message} Expected array length: {expected_length}, but was: {len(array)}")
+        raise AssertionException(f"{_resolve_message(message)} Expected array length: {expected_length}, but was: {len(array)}")
 
-def assert_object_is_empty(obj: object, message: str):
+def assert_object_is_empty(obj: object, message: Message):
     """
     Asserts that the given object (dict, list, or string) is empty.
 
     Args:
         obj (object): The object to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the object is not empty.
     """
-    if isinstance(obj, (dict, list, str)) and obj:
-        raise AssertionException(f"{message} Expected empty object, but was not.")
+    if isinstance(obj, _EMPTY_CHECK_TYPES) and obj:
+        raise AssertionException(f"{_resolve_message(message)} Expected empty object, but was not.")
 
-def assert_object_is_not_empty(obj: object, message: str):
+def assert_object_is_not_empty(obj: object, message: Message):
     """
     Asserts that the given object (dict, list, or string) is not empty.
 
     Args:
         obj (object): The object to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the object is empty.
     """
-    if isinstance(obj, (dict, list, str)) and not obj:
-        raise AssertionException(f"{message} Expected non-empty object, but was empty.")
+    if isinstance(obj, _EMPTY_CHECK_TYPES) and not obj:
+        raise AssertionException(f"{_resolve_message(message)} Expected non-empty object, but was empty.")
 
-def assert_object_includes(obj: Dict, value: object, message: str):
+def assert_object_includes(obj: Dict, value: object, message: Message):
     """
     Asserts that the given object (dict) includes the specified value.
 
     Args:
         obj (Dict): The dictionary to check.
         value (object): The value to check for.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the object does not include the value.
     """
     if value not in obj.values():
-        raise AssertionException(f"{message} Object does not include value: {value}")
+        raise AssertionException(f"{_resolve_message(message)} Object does not include value: {value}")
 
-def assert_string_is_empty(s: str, message: str):
+def assert_string_is_empty(s: str, message: Message):
     """
     Asserts that the given string is empty.
 
     Args:
         s (str): The string to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the string is not empty.
     """
     if s:
-        raise AssertionException(f"{message} Expected empty string, but was not.")
+        raise AssertionException(f"{_resolve_message(message)} Expected empty string, but was not.")
 
-def assert_string_is_not_empty(s: str, message: str):
+def assert_string_is_not_empty(s: str, message: Message):
     """
     Asserts that the given string is not empty.
 
     Args:
         s (str): The string to check.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the string is empty.
     """
     if not s:
-        raise AssertionException(f"{message} Expected non-empty string, but was empty.")
+        raise AssertionException(f"{_resolve_message(message)} Expected non-empty string, but was empty.")
 
-def assert_string_matches_pattern(s: str, pattern: str, message: str):
+def assert_string_matches_pattern(s: str, pattern: str, message: Message):
     """
     Asserts that the given string matches the specified regular expression pattern.
 
     Args:
         s (str): The string to check.
         pattern (str): The regular expression pattern.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the string does not match the pattern.
     """
-    if not re.match(pattern, s):
-        raise AssertionException(f"{message} String does not match pattern: {pattern}")
+    if not _get_regex(pattern).match(s):
+        raise AssertionException(f"{_resolve_message(message)} String does not match pattern: {pattern}")
 
-def assert_function_throws(func: Callable, expected_exception: Type[Exception], message: str):
+def assert_function_throws(func: Callable, expected_exception: Type[Exception], message: Message):
     """
     Asserts that the given function throws the expected exception.
 
     Args:
         func (Callable): The function to call.
         expected_exception (Type[Exception]): The expected exception type.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the function does not throw the expected exception.
     """
     try:
         func()
+    except expected_exception:
+        return
     except Exception as e:
-        if isinstance(e, expected_exception):
-            return
-        else:
-            raise AssertionException(f"{message} Expected exception: {expected_exception.__name__}, but was: {e.__class__.__name__}")
-    raise AssertionException(f"{message} Expected exception, but none was thrown.")
+        raise AssertionException(f"{_resolve_message(message)} Expected exception: {expected_exception.__name__}, but was: {e.__class__.__name__}") from None
+    raise AssertionException(f"{_resolve_message(message)} Expected exception, but none was thrown.")
 
-def assert_function_does_not_throw(func: Callable, message: str):
+def assert_function_does_not_throw(func: Callable, message: Message):
     """
     Asserts that the given function does not throw any exception.
 
     Args:
         func (Callable): The function to call.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the function throws an exception.
@@ -840,20 +1024,30 @@ def assert_function_does_not_throw(func: Callable, message: str):
     try:
         func()
     except Exception as e:
-        raise AssertionException(f"{message} Expected no exception, but caught: {e.__class__.__name__}")
+        raise AssertionException(f"{_resolve_message(message)} Expected no exception, but caught: {e.__class__.__name__}")
 
-def assert_function_returns(expected_value: T, func: Callable[[], T], message: str):
+def assert_function_returns(expected_value: T, func: Callable[[], T], message: Message):
     """
     Asserts that the given function returns the expected value.
 
     Args:
         expected_value (T): The expected return value.
         func (Callable[[], T]): The function to call.
-        message (str): The error message if the assertion fails.
+        message (str | Callable[[], str]): The error message if the assertion fails.
 
     Raises:
         AssertionException: If the function does not return the expected value.
     """
     result = func()
     if result != expected_value:
-        raise AssertionException(f"{message} Expected return: {expected_value}, but was: {result}")
\ No newline at end of file
+        raise AssertionException(f"{_resolve_message(message)} Expected return: {expected_value}, but was: {result}")
+
+# Opt-in: under -O with QANEXUS_DISABLE_ASSERTIONS=1, every assert_* function is rebound to a
+# no-op, so optimized runs skip their bodies (and any functions they would call) entirely.
+if not __debug__ and Constants.DISABLE_ASSERTIONS_WHEN_OPTIMIZED:
+    def _noop(*args, **kwargs):
+        pass
+
+    for _name in list(globals()):
+        if _name.startswith("assert_"):
+            globals()[_name] = _noop
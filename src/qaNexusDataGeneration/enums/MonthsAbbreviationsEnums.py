@@ -20,19 +20,11 @@ class MonthsAbbreviationsEnums(Enum):
     NOV = "Nov"
     DEC = "Dec"
 
-    def __init__(self, abbreviation):
-        """
-        Constructs an instance of MonthsAbbreviationsEnums with the specified abbreviation.
-
-        :param abbreviation: The abbreviation of the month
-        """
-        self._abbreviation = abbreviation
-
     @property
     def abbreviation(self):
         """
-        Returns the abbreviation of the month.
+        Returns the abbreviation of the month, which is the enum value itself.
 
         :return: The abbreviation of the month
         """
-        return self._abbreviation
+        return self.value
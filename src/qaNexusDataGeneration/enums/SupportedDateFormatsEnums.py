@@ -21,13 +21,53 @@ class SupportedDateFormatsEnums(Enum):
 
         :param date_format: The date format pattern
         """
-        self._date_format = date_format
+        # Which date parts the pattern contains, computed once instead of per use
+        self._has_year = "yyyy" in date_format or "YYYY" in date_format
+        self._has_month_abbreviation = "MMM" in date_format
+        self._has_month_number = "MM" in date_format and not self._has_month_abbreviation
+        self._has_day = "dd" in date_format or "DD" in date_format
 
     @property
     def date_format(self):
         """
-        Returns the date format pattern associated with this enum constant.
+        Returns the date format pattern associated with this enum constant, which is the enum value itself.
 
         :return: The date format pattern
         """
-        return self._date_format
+        return self.value
+
+    @property
+    def has_year(self):
+        """
+        Returns whether the date format pattern contains a year.
+
+        :return: True if the pattern contains "yyyy" or "YYYY"
+        """
+        return self._has_year
+
+    @property
+    def has_month_abbreviation(self):
+        """
+        Returns whether the date format pattern contains an abbreviated month name.
+
+        :return: True if the pattern contains "MMM"
+        """
+        return self._has_month_abbreviation
+
+    @property
+    def has_month_number(self):
+        """
+        Returns whether the date format pattern contains a numeric month.
+
+        :return: True if the pattern contains "MM" but not "MMM"
+        """
+        return self._has_month_number
+
+    @property
+    def has_day(self):
+        """
+        Returns whether the date format pattern contains a day.
+
+        :return: True if the pattern contains "dd" or "DD"
+        """
+        return self._has_day
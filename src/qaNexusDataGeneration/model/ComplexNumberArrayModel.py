@@ -0,0 +1,74 @@
+from typing import Union
+
+import numpy as np
+
+from qaNexusDataGeneration.model.ComplexNumberModel import ComplexNumber
+
+
+class ComplexNumberArray:
+    """
+    Represents a batch of complex numbers stored column-wise.
+
+    The real and imaginary parts are kept in two separate float64 arrays rather than
+    as one `ComplexNumber` object per element, which keeps large batches compact and
+    ready for vectorized arithmetic.
+
+    Attributes:
+        real (np.ndarray): The real parts of the complex numbers.
+        imaginary (np.ndarray): The imaginary parts of the complex numbers.
+    """
+
+    __slots__ = ("real", "imaginary")
+
+    def __init__(self, real: np.ndarray, imaginary: np.ndarray):
+        """
+        Constructs a `ComplexNumberArray` from matching arrays of real and imaginary parts.
+
+        Args:
+            real (np.ndarray): The real parts of the complex numbers.
+            imaginary (np.ndarray): The imaginary parts of the complex numbers.
+        """
+        self.real = real
+        self.imaginary = imaginary
+
+    def get_real(self) -> np.ndarray:
+        """
+        Returns the real parts of the complex numbers in this batch.
+
+        Returns:
+            np.ndarray: The real parts of the complex numbers.
+        """
+        return self.real
+
+    def get_imaginary(self) -> np.ndarray:
+        """
+        Returns the imaginary parts of the complex numbers in this batch.
+
+        Returns:
+            np.ndarray: The imaginary parts of the complex numbers.
+        """
+        return self.imaginary
+
+    def __len__(self) -> int:
+        """
+        Returns the number of complex numbers in this batch.
+
+        Returns:
+            int: The number of complex numbers.
+        """
+        return len(self.real)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ComplexNumber, "ComplexNumberArray"]:
+        """
+        Returns the complex number at the given position as a `ComplexNumber`, or a
+        `ComplexNumberArray` holding the selected complex numbers when given a slice.
+
+        Args:
+            index (int | slice): The position of the complex number, or a slice of positions.
+
+        Returns:
+            ComplexNumber | ComplexNumberArray: The selected complex number or numbers.
+        """
+        if isinstance(index, slice):
+            return ComplexNumberArray(self.real[index], self.imaginary[index])
+        return ComplexNumber(float(self.real[index]), float(self.imaginary[index]))
@@ -9,6 +9,8 @@ class ComplexNumber:
         real (float): The real part of the complex number.
         imaginary (float): The imaginary part of the complex number.
     """
+
+    __slots__ = ("real", "imaginary")
     
     def __init__(self, real: float, imaginary: float):
         """
@@ -0,0 +1,40 @@
+"""
+Optional Numba-compiled kernels used by the bulk data generators.
+
+Numba is not a required dependency. When it is not installed NUMBA_AVAILABLE is False
+and callers fall back to the NumPy implementations in data_generator.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def fill_alpha(out, alpha, seed):
+        """
+        Fills a 2D uint8 buffer with bytes drawn uniformly from an alphabet.
+
+        Random numbers come from a splitmix64 stream started at seed, so the whole
+        buffer is produced in one compiled loop without calling back into Python.
+
+        Args:
+            out (np.ndarray): The (n, length) uint8 buffer to fill.
+            alpha (np.ndarray): The uint8 alphabet to draw from.
+            seed (int): The initial splitmix64 state.
+        """
+        state = np.uint64(seed)
+        size = np.uint64(alpha.size)
+        for i in range(out.shape[0]):
+            for j in range(out.shape[1]):
+                state += np.uint64(0x9E3779B97F4A7C15)
+                z = state
+                z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+                z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+                z = z ^ (z >> np.uint64(31))
+                out[i, j] = alpha[z % size]
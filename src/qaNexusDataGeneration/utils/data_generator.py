@@ -1,11 +1,19 @@
+import os
 import re
 import random
 import uuid
 import time
 import math
+import threading
 import numpy as np
+from functools import lru_cache
 from typing import List
-from datetime import datetime
+from datetime import date, datetime
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
 from qaNexusDataGeneration.statictVariables.DataGeneratorConstants import Constants
 from qaNexusDataGeneration.enums.SupportedDateFormatsEnums import (
     SupportedDateFormatsEnums,
@@ -17,6 +25,88 @@ from qaNexusDataGeneration.enums.MonthsAbbreviationsEnums import (
     MonthsAbbreviationsEnums,
 )
 from qaNexusDataGeneration.model.ComplexNumberModel import ComplexNumber
+from qaNexusDataGeneration.model.ComplexNumberArrayModel import ComplexNumberArray
+from qaNexusDataGeneration.utils import _fast
+
+# Parsed forms of the character classes that expand to a single digit (\d and [0-9]).
+_DIGIT_CLASSES = (
+    [(sre_parse.CATEGORY, sre_parse.CATEGORY_DIGIT)],
+    [(sre_parse.RANGE, (ord("0"), ord("9")))],
+)
+
+# Date format tokens, longest first so "MMM" is never consumed as "MM".
+_DATE_TOKEN_RE = re.compile(r"YYYY|yyyy|MMM|MM|DD|dd")
+
+# Replacement field each date format token becomes in a rendering template.
+_DATE_TOKEN_FIELDS = {
+    "YYYY": "{year}",
+    "yyyy": "{year}",
+    "MMM": "{month}",
+    "MM": "{month}",
+    "DD": "{day}",
+    "dd": "{day}",
+}
+
+# Days in each month of a non-leap year, indexed by month number (1 for January).
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Zero-padded two-digit strings, indexed by value.
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(100))
+
+# Month abbreviations used by generate_date.
+_MONTH_ABBREVS = tuple(m.value for m in MonthsAbbreviationsEnums)
+
+# Per-thread random instances, so concurrent callers never share generator state.
+_THREAD_LOCAL = threading.local()
+
+
+def _thread_random():
+    """
+    Returns the random.Random instance owned by the calling thread, creating it on first use.
+
+    :return: A random.Random instance local to the current thread.
+    """
+    rng = getattr(_THREAD_LOCAL, "rng", None)
+    if rng is None:
+        rng = _THREAD_LOCAL.rng = random.Random()
+    return rng
+
+
+# Alphabets used by generate_string and the numeric identifier generators.
+_ALPHA_TUPLE = tuple(Constants.ALPHA_NUM)
+_DIGIT_TUPLE = tuple("0123456789")
+
+# Bound methods of the shared random instance, so each call is a single global lookup
+# instead of a module attribute lookup. They share state with random.seed().
+_CHOICES = random.choices
+_CHOICE = random.choice
+_RANDINT = random.randint
+_UNIFORM = random.uniform
+_GAUSS = random.gauss
+_SAMPLE = random.sample
+_EXPOVARIATE = random.expovariate
+_RANDBYTES = random.randbytes
+
+# Maps each ASCII digit to the numeric value it contributes to a Luhn sum once doubled.
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes((0, 2, 4, 6, 8, 1, 3, 5, 7, 9)))
+
+# Shared NumPy generator and ASCII lookup table used by the batch generators.
+_RNG = np.random.default_rng()
+_ALPHA_ARR = np.frombuffer(Constants.ALPHA_NUM.encode("ascii"), dtype=np.uint8)
+_DIGIT_ARR = np.frombuffer(b"0123456789", dtype=np.uint8)
+
+
+def _random_digits(count):
+    """
+    Generates a string of random decimal digits in a single draw from the random module.
+
+    Scalar generators stay on the random module so that random.seed() keeps their
+    output reproducible; NumPy is reserved for the batch generators.
+
+    :param count: The number of digits to generate.
+    :return: A string of count random digits.
+    """
+    return "".join(_CHOICES(_DIGIT_TUPLE, k=count))
 
 
 def generate_string(length=Constants.DEFAULT_STRING_LENGTH):
@@ -26,7 +116,39 @@ def generate_string(length=Constants.DEFAULT_STRING_LENGTH):
     :param length: The length of the generated string. Defaults to Constants.DEFAULT_STRING_LENGTH.
     :return: A randomly generated string.
     """
-    return "".join(random.choices(Constants.ALPHA_NUM, k=length))
+    return "".join(_CHOICES(_ALPHA_TUPLE, k=length))
+
+
+def generate_strings(n, length=Constants.DEFAULT_STRING_LENGTH):
+    """
+    Generates a batch of random strings in a single vectorized draw.
+
+    :param n: The number of strings to generate.
+    :param length: The length of each generated string. Defaults to Constants.DEFAULT_STRING_LENGTH.
+    :return: A list of n randomly generated strings.
+    """
+    idx = _RNG.integers(0, _ALPHA_ARR.size, size=(n, length), dtype=np.uint8)
+    buf = _ALPHA_ARR[idx]
+    return [row.tobytes().decode("ascii") for row in buf]
+
+
+def generate_strings_fast(n, length=Constants.DEFAULT_STRING_LENGTH):
+    """
+    Generates a batch of random strings using a Numba-compiled kernel when available.
+
+    Intended for bulk workloads such as load-test fixtures. Falls back to generate_strings
+    when Numba is not installed. The kernel is seeded from the random module, so
+    random.seed() makes its output reproducible.
+
+    :param n: The number of strings to generate.
+    :param length: The length of each generated string. Defaults to Constants.DEFAULT_STRING_LENGTH.
+    :return: A list of n randomly generated strings.
+    """
+    if not _fast.NUMBA_AVAILABLE:
+        return generate_strings(n, length)
+    buf = np.empty((n, length), dtype=np.uint8)
+    _fast.fill_alpha(buf, _ALPHA_ARR, random.getrandbits(63))
+    return [row.tobytes().decode("ascii") for row in buf]
 
 
 def generate_email(
@@ -44,6 +166,22 @@ def generate_email(
     return username + domain
 
 
+def generate_emails(
+    n,
+    domain=Constants.DEFAULT_DOMAIN,
+    username_length=Constants.DEFAULT_EMAIL_USERNAME_LENGTH,
+):
+    """
+    Generates a batch of random email addresses, drawing every username in a single vectorized call.
+
+    :param n: The number of email addresses to generate.
+    :param domain: The domain to use for the email addresses. Defaults to DEFAULT_DOMAIN.
+    :param username_length: The length of the username part of each email address. Defaults to DEFAULT_EMAIL_USERNAME_LENGTH.
+    :return: A list of n randomly generated email addresses.
+    """
+    return [username + domain for username in generate_strings(n, username_length)]
+
+
 def generate_phone_number(country_code="US"):
     """
     Generates a random phone number based on the specified country code.
@@ -52,18 +190,16 @@ def generate_phone_number(country_code="US"):
     :return: A randomly generated phone number in the format corresponding to the given country code.
     :raises ValueError: If the country code is invalid.
     """
-    try:
-        country_enum = CountryCodePhoneNumberPatternEnums[country_code]
-    except KeyError:
+    template = _PHONE_TEMPLATES.get(country_code)
+    if template is None:
         raise ValueError(f"Invalid country code: {country_code}")
 
-    phone_regex = country_enum.value
-    pattern = re.compile(phone_regex)
-
-    phone_number = generate_random_phone_number(phone_regex)
+    phone_number = _emit_phone_template(template)
 
-    while not pattern.match(phone_number):
-        phone_number = generate_random_phone_number(phone_regex)
+    # The pattern is expanded directly, so the result always matches; the check
+    # is dropped entirely under ``python -O``.
+    if __debug__:
+        assert _PHONE_PATTERNS[country_code].fullmatch(phone_number), phone_number
 
     return phone_number
 
@@ -74,40 +210,100 @@ def generate_random_phone_number(pattern):
 
     :param pattern: The pattern to use for generating the phone number.
     :return: A randomly generated phone number.
+    :raises ValueError: If the pattern uses a construct that cannot be expanded.
+    """
+    return _emit_phone_template(_parse_phone_template(pattern))
+
+
+@lru_cache(maxsize=256)
+def _parse_phone_template(pattern):
     """
-    phone_number = []
-    is_escaped = False
-    i = 0
-
-    while i < len(pattern):
-        ch = pattern[i]
-
-        if is_escaped:
-            if ch == "d":
-                # Handle \d{n} pattern
-                if i + 1 < len(pattern) and pattern[i + 1] == "{":
-                    closing_brace_index = pattern.find("}", i + 2)
-                    if closing_brace_index != -1:
-                        repeat_count_str = pattern[i + 2 : closing_brace_index]
-                        repeat_count = int(repeat_count_str)
-                        phone_number.extend([str(random.randint(0, 9))] * repeat_count)
-                        i = closing_brace_index
-                    else:
-                        phone_number.append("d")
-                else:
-                    phone_number.append(str(random.randint(0, 9)))
-            else:
-                phone_number.append(ch)
-            is_escaped = False
+    Parses a phone number pattern into a generation template.
+
+    The pattern is parsed with the regular expression parser itself, so every
+    generated number is guaranteed to match it. The template is a tuple
+    ``(format_string, digit_count)``: the pattern's literal text with one ``{}``
+    field per random digit, and the number of digits to fill in. Templates are
+    cached, so a pattern passed repeatedly is only parsed once.
+
+    :param pattern: The pattern to parse.
+    :return: The generation template for the pattern.
+    :raises ValueError: If the pattern uses a construct that cannot be expanded.
+    """
+    segments = []
+    _append_phone_segments(segments, sre_parse.parse(pattern))
+    format_string = "".join(
+        literal.replace("{", "{{").replace("}", "}}") + "{}" * count
+        for literal, count in segments
+    )
+    return format_string, sum(count for _, count in segments)
+
+
+def _append_phone_segments(segments, parsed):
+    """
+    Walks a parsed regular expression and appends its generation segments to segments.
+
+    :param segments: The segment list to extend.
+    :param parsed: The parsed (sub)pattern to walk.
+    :raises ValueError: If the pattern uses a construct that cannot be expanded.
+    """
+    for op, av in parsed:
+        if op == sre_parse.LITERAL:
+            _append_phone_segment(segments, literal=chr(av))
+        elif op == sre_parse.IN and av in _DIGIT_CLASSES:
+            _append_phone_segment(segments, digits=1)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] == av[1]:
+            for _ in range(av[0]):
+                _append_phone_segments(segments, av[2])
+        elif op == sre_parse.SUBPATTERN:
+            _append_phone_segments(segments, av[-1])
+        elif op == sre_parse.AT:
+            continue
         else:
-            if ch == "\\":
-                is_escaped = True
-            else:
-                phone_number.append(ch)
+            raise ValueError(f"Unsupported phone number pattern construct: {op}")
+
+
+def _append_phone_segment(segments, literal="", digits=0):
+    """
+    Appends literal text or digits, merging into the last segment when the order allows it.
+
+    :param segments: The segment list to extend.
+    :param literal: Literal text to append.
+    :param digits: Number of random digits to append.
+    """
+    if segments and (not literal or segments[-1][1] == 0):
+        last_literal, last_digits = segments[-1]
+        segments[-1] = (last_literal + literal, last_digits + digits)
+    else:
+        segments.append((literal, digits))
+
+
+def _emit_phone_template(template):
+    """
+    Generates a random phone number from a pre-parsed template.
+
+    :param template: The template returned by _parse_phone_template.
+    :return: A randomly generated phone number.
+    """
+    format_string, digit_count = template
+    # Draw every digit the pattern needs at once; each one fills the next field
+    return format_string.format(*_random_digits(digit_count))
 
-        i += 1
 
-    return "".join(phone_number)
+# Generation templates for every supported country, keyed by country code.
+# Patterns are only parsed here, at import; generation itself never touches the regex engine.
+# __members__ is used so aliases sharing a pattern (e.g. US and CA) get their own entry.
+_PHONE_TEMPLATES = {
+    name: _parse_phone_template(country.value)
+    for name, country in CountryCodePhoneNumberPatternEnums.__members__.items()
+}
+
+# Compiled patterns backing the debug-only output check; not built under ``python -O``.
+if __debug__:
+    _PHONE_PATTERNS = {
+        name: re.compile(country.value)
+        for name, country in CountryCodePhoneNumberPatternEnums.__members__.items()
+    }
 
 
 def get_max_days(month, year):
@@ -117,13 +313,14 @@ def get_max_days(month, year):
     :param month: The month (1 for January, 2 for February, etc.)
     :param year: The year
     :return: The maximum number of days in the given month
+    :raises ValueError: If the month is not between 1 and 12.
     """
-    if month == 2:  # February
-        return 29 if (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) else 28
-    elif month in {4, 6, 9, 11}:  # April, June, September, November
-        return 30
-    else:  # All other months
-        return 31
+    if not 1 <= month <= 12:
+        raise ValueError(f"Invalid month: {month}. Expected a value between 1 and 12.")
+    # Leap year: divisible by 4, and either not by 100 or also by 400. Once a year is
+    # known to be a multiple of 4, "% 100" reduces to "% 25" and "% 400" to "& 15".
+    is_leap = not (year & 3) and (year % 25 != 0 or not (year & 15))
+    return _DAYS_IN_MONTH[month] + (month == 2 and is_leap)
 
 
 def generate_date(format=Constants.DEFAULT_DATE_FORMAT):
@@ -133,61 +330,84 @@ def generate_date(format=Constants.DEFAULT_DATE_FORMAT):
     :param format: An instance of SupportedDateFormatsEnums specifying the date format to use
     :return: A randomly generated date in the specified format
     """
+    # Enum members are precompiled; plain format strings go through the bounded cache
+    info = _DATE_FORMAT_INFO.get(format)
+    if info is None:
+        info = _compile_date_format(format)
+    template, has_year, has_month_abbreviation, has_month_number, has_day = info
+
     year = -1
     month = ""
     day = ""
 
-    secure_random = random.Random()
+    # One draw covers every field: 24 bits for the year, 16 for the month and 24 for the day.
+    # Reducing a k-bit field modulo m favours some values by at most m / 2**k relative to the
+    # others, i.e. under 0.02% for the month and far less for the year and day.
+    bits = _thread_random().getrandbits(64)
+
+    if has_year:
+        # Random year between 1900 and current year
+        year = 1900 + (bits & 0xFFFFFF) % (date.today().year - 1899)
 
-    # Get the current date and time
-    now = datetime.now()
+    month_num = 1 + ((bits >> 24) & 0xFFFF) % 12  # Random month between 1 and 12
+    if has_month_abbreviation:
+        month = _MONTH_ABBREVS[month_num - 1]
+    elif has_month_number:
+        month = _TWO_DIGIT[month_num]
 
-    # Extract the current year
-    current_year = now.year
+    if has_day:
+        if not (has_month_abbreviation or has_month_number):
+            max_days = 31
+        elif has_year:
+            max_days = get_max_days(month_num, year)
+        else:
+            # Without a year, February 29th is still a valid date
+            max_days = _DAYS_IN_MONTH[month_num] + (month_num == 2)
+        day = _TWO_DIGIT[1 + (bits >> 40) % max_days]  # Random day
+
+    return template.format(year=year, month=month, day=day)
+
+
+@lru_cache(maxsize=128)
+def _compile_date_format(format):
+    """
+    Precomputes how generate_date renders a date format.
 
-    # Handle case where format is a string rather than an Enum instance
+    The format becomes a str.format template, with literal braces escaped and each date
+    token replaced by a named field, alongside flags for the date parts it contains.
+    Enum members supply their own precomputed flags. Results are cached, so
+    repeated string formats are only compiled once.
+
+    :param format: A SupportedDateFormatsEnums member or a date format string, e.g. "yyyy-MM-dd".
+    :return: A tuple (template, has_year, has_month_abbreviation, has_month_number, has_day).
+    """
     if isinstance(format, str):
         format_string = format
+        has_year = "yyyy" in format_string or "YYYY" in format_string
+        has_month_abbreviation = "MMM" in format_string
+        has_month_number = "MM" in format_string and not has_month_abbreviation
+        has_day = "dd" in format_string or "DD" in format_string
     else:
-        format_string = format.date_format
-
-    if "yyyy" in format_string or "YYYY" in format_string:
-        year = secure_random.randint(
-            1900, current_year
-        )  # Random year between 1900 and current year
-
-    if "MM" in format_string:
-        month_num = secure_random.randint(1, 12)  # Random month between 1 and 12
-        month = f"{month_num:02d}"
-    if "MMM" in format_string:
-        month_enum = secure_random.choice(list(MonthsAbbreviationsEnums))
-        month = month_enum.abbreviation
-
-    if "dd" in format_string:
-        if year != -1 and month.isdigit():
-            max_days = get_max_days(int(month), year)
-        else:
-            max_days = 31
-        day = f"{secure_random.randint(1, max_days):02d}"  # Random day
+        format_string = format.value
+        has_year = format.has_year
+        has_month_abbreviation = format.has_month_abbreviation
+        has_month_number = format.has_month_number
+        has_day = format.has_day
+    escaped = format_string.replace("{", "{{").replace("}", "}}")
+    template = _DATE_TOKEN_RE.sub(lambda m: _DATE_TOKEN_FIELDS[m.group()], escaped)
+    return template, has_year, has_month_abbreviation, has_month_number, has_day
 
-    if "DD" in format_string:
-        if year != -1 and month.isdigit():
-            max_days = get_max_days(int(month), year)
-        else:
-            max_days = 31
-        day = f"{secure_random.randint(1, max_days):02d}"  # Random day
-
-    return (
-        format_string.replace("YYYY", str(year))
-        .replace("yyyy", str(year))
-        .replace("MMM", month)
-        .replace("MM", month)
-        .replace("DD", day)
-        .replace("dd", day)
-    )
+
+# Rendering metadata for every supported date format, keyed by enum member. Plain string
+# formats are left to the bounded cache on _compile_date_format.
+_DATE_FORMAT_INFO = {
+    member: _compile_date_format.__wrapped__(member) for member in SupportedDateFormatsEnums
+}
 
 
-def generate_uuid(type=Constants.DEFAULT_UUID_TYPE):
+def generate_uuid(
+    type=Constants.DEFAULT_UUID_TYPE, namespace=uuid.NAMESPACE_DNS, name=None
+):
     """
     Generate a UUID based on the specified type.
 
@@ -202,6 +422,8 @@ def generate_uuid(type=Constants.DEFAULT_UUID_TYPE):
     Parameters:
     type (str): The type of UUID to generate. Must be one of "v1", "v3", "v4", or "v5".
                 Defaults to `Constants.DEFAULT_UUID_TYPE`.
+    namespace (uuid.UUID): The namespace used by v3 and v5 UUIDs. Defaults to `uuid.NAMESPACE_DNS`.
+    name (str): The name used by v3 and v5 UUIDs. Defaults to a random string.
 
     Returns:
     str: A string representation of the generated UUID.
@@ -220,19 +442,31 @@ def generate_uuid(type=Constants.DEFAULT_UUID_TYPE):
     '6ba7b810-9dad-11d1-80b4-00c04fd430c8'
 
     Notes:
-    - For UUID versions v3 and v5, the name parameter is hardcoded in this implementation.
-    To customize, you might need to modify the method or provide additional parameters.
+    - For UUID versions v3 and v5, the same namespace and name always produce the same UUID.
+    When no name is given a random one is generated, so the result is random as well.
     """
     if type == "v1":
         return str(uuid.uuid1())
     elif type == "v3":
-        return str(uuid.uuid3())
-    elif type == "v4":
-        return str(uuid.uuid4())
+        return str(uuid.uuid3(namespace, generate_string() if name is None else name))
     elif type == "v5":
-        return str(uuid.uuid5())
+        return str(uuid.uuid5(namespace, generate_string() if name is None else name))
     else:
-        return str(uuid.uuid4())
+        return _uuid4()
+
+
+def _uuid4():
+    """
+    Generates a random (version 4) UUID string without building a uuid.UUID object.
+
+    Returns:
+    str: A string representation of the generated UUID.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # Version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def generate_ssn():
@@ -242,9 +476,29 @@ def generate_ssn():
     Returns:
         str: A randomly generated SSN in the format "XXX-XX-XXXX".
     """
-    return "{:03d}-{:02d}-{:04d}".format(
-        random.randint(0, 999), random.randint(0, 99), random.randint(0, 9999)
-    )
+    digits = f"{_RANDINT(0, 999_999_999):09d}"
+    return f"{digits[:3]}-{digits[3:5]}-{digits[5:]}"
+
+
+def generate_ssns(n):
+    """
+    Generates a batch of random Social Security Numbers (SSNs) in the format "XXX-XX-XXXX".
+
+    All digits are drawn in a single vectorized call and the dashes are written into
+    the same byte buffer, so each SSN is decoded straight from one row.
+
+    Args:
+        n (int): The number of SSNs to generate.
+
+    Returns:
+        list[str]: A list of n randomly generated SSNs.
+    """
+    buf = np.full((n, 11), ord("-"), dtype=np.uint8)
+    digits = _DIGIT_ARR[_RNG.integers(0, 10, size=(n, 9), dtype=np.uint8)]
+    buf[:, 0:3] = digits[:, 0:3]
+    buf[:, 4:6] = digits[:, 3:5]
+    buf[:, 7:11] = digits[:, 5:9]
+    return [row.tobytes().decode("ascii") for row in buf]
 
 
 def generate_passport_number():
@@ -254,8 +508,7 @@ def generate_passport_number():
     Returns:
         str: A randomly generated passport number as a string of 9 digits.
     """
-    passport_number = "".join(str(random.randint(0, 9)) for _ in range(9))
-    return passport_number
+    return _random_digits(9)
 
 
 def calculate_luhn_checksum(number):
@@ -267,17 +520,18 @@ def calculate_luhn_checksum(number):
 
     Returns:
         int: The Luhn checksum digit.
-    """
-    sum_ = 0
-    alternate = False
-    for i in range(len(number) - 1, -1, -1):
-        n = int(number[i])
-        if alternate:
-            n *= 2
-            if n > 9:
-                n -= 9
-        sum_ += n
-        alternate = not alternate
+
+    Raises:
+        ValueError: If the number contains anything other than ASCII digits.
+    """
+    if not (number.isascii() and number.isdigit()):
+        raise ValueError(f"Invalid number for Luhn checksum: {number!r}")
+    # Walking from the right, every second digit is doubled (minus 9 above 9). Both
+    # halves are summed over bytes, with the doubling done by a translation table.
+    data = number.encode("ascii")
+    plain = data[-1::-2]
+    doubled = data[-2::-2].translate(_LUHN_DOUBLED)
+    sum_ = sum(plain) - 48 * len(plain) + sum(doubled)
     return (10 - (sum_ % 10)) % 10
 
 
@@ -288,7 +542,7 @@ def generate_credit_card_number():
     Returns:
         str: A randomly generated credit card number.
     """
-    cc_number = "".join(str(random.randint(0, 9)) for _ in range(15))
+    cc_number = _random_digits(15)
     checksum = calculate_luhn_checksum(cc_number)
     return cc_number + str(checksum)
 
@@ -300,7 +554,7 @@ def generate_bank_account_number():
     Returns:
         str: A randomly generated bank account number as a string of 12 digits.
     """
-    return "".join(str(random.randint(0, 9)) for _ in range(12))
+    return _random_digits(12)
 
 
 def generate_iban():
@@ -311,7 +565,7 @@ def generate_iban():
         str: A randomly generated IBAN with the country code "DE" followed by 20 digits.
     """
     country_code = "DE"
-    return country_code + "".join(str(random.randint(0, 9)) for _ in range(20))
+    return country_code + _random_digits(20)
 
 
 def generate_boolean():
@@ -321,20 +575,24 @@ def generate_boolean():
     Returns:
         bool: A randomly generated boolean value.
     """
-    return random.choice([True, False])
+    return _CHOICE([True, False])
 
 
-def generate_binary_data(length):
+def generate_binary_data(length, seed=None):
     """
     Generates random binary data of the specified length.
 
     Args:
         length (int): The length of the binary data.
+        seed (int, optional): Seed for reproducible output. When omitted, the bytes come
+            from the operating system's random source.
 
     Returns:
         bytes: A randomly generated byte array of the specified length.
     """
-    return random.randbytes(length)
+    if seed is not None:
+        return np.random.default_rng(seed).bytes(length)
+    return os.urandom(length)
 
 
 def generate_timestamp():
@@ -344,10 +602,28 @@ def generate_timestamp():
     Returns:
         str: A randomly generated timestamp in ISO 8601 format.
     """
-    current_time = int(time.time() * 1000)
-    random_millis = random.randint(0, 1000000000)
+    current_time = time.time_ns() // 1_000_000
+    random_millis = _RANDINT(0, 1000000000)
     random_time = current_time - random_millis
-    return datetime.datetime.fromtimestamp(random_time / 1000).isoformat()
+    return datetime.fromtimestamp(random_time / 1000).isoformat()
+
+
+def generate_timestamps(n):
+    """
+    Generates a batch of random timestamps, drawing every offset in a single vectorized call.
+
+    Args:
+        n (int): The number of timestamps to generate.
+
+    Returns:
+        list[str]: A list of n randomly generated timestamps in ISO 8601 format.
+    """
+    current_time = time.time_ns() // 1_000_000
+    offsets = _RNG.integers(0, 1000000000, size=n, endpoint=True).tolist()
+    return [
+        datetime.fromtimestamp((current_time - random_millis) / 1000).isoformat()
+        for random_millis in offsets
+    ]
 
 
 def generate_unix_timestamp():
@@ -357,7 +633,7 @@ def generate_unix_timestamp():
     Returns:
         int: A randomly generated Unix timestamp.
     """
-    return int(time.time()) - random.randint(0, 1000000000)
+    return int(time.time()) - _RANDINT(0, 1000000000)
 
 
 def generate_time():
@@ -367,9 +643,9 @@ def generate_time():
     Returns:
         str: A randomly generated time.
     """
-    hours = random.randint(0, 23)
-    minutes = random.randint(0, 59)
-    seconds = random.randint(0, 59)
+    hours = _RANDINT(0, 23)
+    minutes = _RANDINT(0, 59)
+    seconds = _RANDINT(0, 59)
     return f"{hours:02}:{minutes:02}:{seconds:02}"
 
 
@@ -380,7 +656,21 @@ def generate_ip_address():
     Returns:
         str: A randomly generated IP address.
     """
-    return f"{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}"
+    return f"{_RANDINT(0, 255)}.{_RANDINT(0, 255)}.{_RANDINT(0, 255)}.{_RANDINT(0, 255)}"
+
+
+def generate_ip_addresses(n):
+    """
+    Generates a batch of random IP addresses in the format "X.X.X.X".
+
+    Args:
+        n (int): The number of IP addresses to generate.
+
+    Returns:
+        list[str]: A list of n randomly generated IP addresses.
+    """
+    octets = _RNG.integers(0, 256, size=(n, 4)).tolist()
+    return [f"{a}.{b}.{c}.{d}" for a, b, c, d in octets]
 
 
 def generate_mac_address():
@@ -390,7 +680,7 @@ def generate_mac_address():
     Returns:
         str: A randomly generated MAC address.
     """
-    return ":".join(f"{random.randint(0, 255):02X}" for _ in range(6))
+    return _RANDBYTES(6).hex(":").upper()
 
 
 def generate_hex_color():
@@ -400,7 +690,7 @@ def generate_hex_color():
     Returns:
         str: A randomly generated hex color code.
     """
-    return f"#{random.randint(0, 0xFFFFFF):06X}"
+    return "#" + _RANDBYTES(3).hex().upper()
 
 
 def generate_int(min_val, max_val):
@@ -414,7 +704,7 @@ def generate_int(min_val, max_val):
     Returns:
         int: A randomly generated integer between min_val and max_val (inclusive).
     """
-    return random.randint(min_val, max_val)
+    return _RANDINT(min_val, max_val)
 
 
 def generate_float(min_val, max_val):
@@ -428,7 +718,7 @@ def generate_float(min_val, max_val):
     Returns:
         float: A randomly generated float between min_val and max_val.
     """
-    return random.uniform(min_val, max_val)
+    return _UNIFORM(min_val, max_val)
 
 
 def generate_double(min_val, max_val):
@@ -442,7 +732,7 @@ def generate_double(min_val, max_val):
     Returns:
         float: A randomly generated double between min_val and max_val.
     """
-    return random.uniform(min_val, max_val)
+    return _UNIFORM(min_val, max_val)
 
 
 def generate_long(min_val, max_val):
@@ -456,7 +746,7 @@ def generate_long(min_val, max_val):
     Returns:
         int: A randomly generated long between min_val and max_val.
     """
-    return random.randint(min_val, max_val)
+    return _RANDINT(min_val, max_val)
 
 
 def generate_byte():
@@ -466,20 +756,24 @@ def generate_byte():
     Returns:
         int: A randomly generated byte.
     """
-    return random.randint(0, 255)
+    return _RANDINT(0, 255)
 
 
-def generate_byte_array(length):
+def generate_byte_array(length, seed=None):
     """
     Generates a random byte array of the specified length.
 
     Args:
         length (int): The length of the byte array.
+        seed (int, optional): Seed for reproducible output. When omitted, the bytes come
+            from the operating system's random source.
 
     Returns:
         bytes: A randomly generated byte array.
     """
-    return random.randbytes(length)
+    if seed is not None:
+        return np.random.default_rng(seed).bytes(length)
+    return os.urandom(length)
 
 
 def generate_short(min_val, max_val):
@@ -493,7 +787,7 @@ def generate_short(min_val, max_val):
     Returns:
         int: A randomly generated short between min_val and max_val (inclusive).
     """
-    return random.randint(min_val, max_val)
+    return _RANDINT(min_val, max_val)
 
 
 def generate_char(min_val, max_val):
@@ -507,7 +801,7 @@ def generate_char(min_val, max_val):
     Returns:
         str: A randomly generated char between min_val and max_val (inclusive).
     """
-    return chr(random.randint(ord(min_val), ord(max_val)))
+    return chr(_RANDINT(ord(min_val), ord(max_val)))
 
 
 def generate_hex(length):
@@ -520,7 +814,8 @@ def generate_hex(length):
     Returns:
         str: A randomly generated hex string.
     """
-    return "".join(f"{random.randint(0, 15):X}" for _ in range(length))
+    # Each random byte yields two hex digits; draw enough bytes and trim an odd length
+    return _RANDBYTES((length + 1) // 2).hex().upper()[:length]
 
 
 def generate_gaussian(mean: float, standard_deviation: float) -> float:
@@ -534,7 +829,7 @@ def generate_gaussian(mean: float, standard_deviation: float) -> float:
     Returns:
         float: A randomly generated Gaussian distributed value.
     """
-    return random.gauss(mean, standard_deviation)
+    return _GAUSS(mean, standard_deviation)
 
 
 def generate_random_with_custom_distribution(probabilities: List[float]) -> int:
@@ -546,8 +841,76 @@ def generate_random_with_custom_distribution(probabilities: List[float]) -> int:
 
     Returns:
         int: A randomly generated integer based on the given probabilities.
+
+    Raises:
+        ValueError: If the probabilities are negative or do not sum to 1.
+    """
+    prob, alias = _alias_table(tuple(probabilities))
+    # One uniform draw from NumPy's global generator, so np.random.seed() still applies:
+    # its integer part picks the column and its fractional part decides the coin flip.
+    u = np.random.random() * prob.size
+    i = min(int(u), prob.size - 1)
+    return i if u - i < prob[i] else int(alias[i])
+
+
+def generate_random_with_custom_distribution_batch(
+    probabilities: List[float], n: int
+) -> np.ndarray:
+    """
+    Generates a batch of random integers based on a custom distribution in a single vectorized draw.
+
+    Args:
+        probabilities (List[float]): An array of probabilities for each integer.
+        n (int): The number of integers to generate.
+
+    Returns:
+        np.ndarray: An array of n randomly generated integers based on the given probabilities.
+
+    Raises:
+        ValueError: If the probabilities are negative or do not sum to 1.
+    """
+    prob, alias = _alias_table(tuple(probabilities))
+    u = np.random.random(n) * prob.size
+    i = np.minimum(u.astype(np.intp), prob.size - 1)
+    return np.where(u - i < prob[i], i, alias[i])
+
+
+@lru_cache(maxsize=32)
+def _alias_table(probabilities):
     """
-    return np.random.choice(len(probabilities), p=probabilities)
+    Builds the Walker alias tables for a discrete distribution (Vose's method).
+
+    A sample picks a column i uniformly, then keeps i with probability prob[i] or
+    otherwise takes alias[i], so each draw costs O(1) whatever the number of outcomes.
+
+    Args:
+        probabilities (tuple): The probability of each integer.
+
+    Returns:
+        tuple: The (prob, alias) arrays.
+
+    Raises:
+        ValueError: If the probabilities are negative or do not sum to 1.
+    """
+    if not probabilities or min(probabilities) < 0 or not math.isclose(
+        math.fsum(probabilities), 1.0, abs_tol=1e-8
+    ):
+        raise ValueError("Probabilities must be non-negative and sum to 1.")
+    k = len(probabilities)
+    scaled = [p * k for p in probabilities]
+    prob = np.ones(k)
+    alias = np.arange(k)
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        under = small.pop()
+        over = large.pop()
+        prob[under] = scaled[under]
+        alias[under] = over
+        scaled[over] += scaled[under] - 1.0
+        (small if scaled[over] < 1.0 else large).append(over)
+    # Whatever is left over is full up to rounding error
+    return prob, alias
 
 
 def generate_random_prime(min_val: int, max_val: int) -> int:
@@ -560,24 +923,82 @@ def generate_random_prime(min_val: int, max_val: int) -> int:
 
     Returns:
         int: A randomly generated prime number between min_val and max_val.
+
+    Raises:
+        ValueError: If max_val is within the sieve limit and the range contains no prime.
+    """
+    if max_val <= _SIEVE_LIMIT:
+        # Pick uniformly among the sieved primes that fall inside the range
+        primes = _sieve_primes()
+        lo = int(np.searchsorted(primes, min_val, side="left"))
+        hi = int(np.searchsorted(primes, max_val, side="right"))
+        if lo >= hi:
+            raise ValueError(f"No prime number between {min_val} and {max_val}")
+        return int(primes[_RANDINT(lo, hi - 1)])
+
+    num = _RANDINT(min_val, max_val)
+    while not _is_prime(num):
+        num = _RANDINT(min_val, max_val)
+    return num
+
+
+# Ranges whose upper bound is at or below this limit are served from a precomputed sieve.
+_SIEVE_LIMIT = 10**6
+
+# Miller-Rabin witnesses that make the test deterministic for every n below 3.3 * 10**24.
+_MILLER_RABIN_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+@lru_cache(maxsize=None)
+def _sieve_primes():
     """
+    Returns every prime up to _SIEVE_LIMIT, computed once with a sieve of Eratosthenes.
 
-    def is_prime(num: int) -> bool:
-        if num <= 1:
-            return False
-        if num == 2:
-            return True
-        if num % 2 == 0:
+    Returns:
+        np.ndarray: The sorted primes up to and including _SIEVE_LIMIT.
+    """
+    is_prime = np.ones(_SIEVE_LIMIT + 1, dtype=bool)
+    is_prime[:2] = False
+    for i in range(2, math.isqrt(_SIEVE_LIMIT) + 1):
+        if is_prime[i]:
+            is_prime[i * i :: i] = False
+    return np.flatnonzero(is_prime)
+
+
+def _is_prime(num: int) -> bool:
+    """
+    Tests num for primality with the Miller-Rabin test.
+
+    With _MILLER_RABIN_WITNESSES as bases the answer is exact for all 64-bit integers.
+
+    Args:
+        num (int): The number to test.
+
+    Returns:
+        bool: True if num is prime.
+    """
+    if num < 2:
+        return False
+    for p in _MILLER_RABIN_WITNESSES:
+        if num % p == 0:
+            return num == p
+    # Write num - 1 as d * 2**r with d odd
+    d = num - 1
+    r = 0
+    while not d & 1:
+        d >>= 1
+        r += 1
+    for a in _MILLER_RABIN_WITNESSES:
+        x = pow(a, d, num)
+        if x == 1 or x == num - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % num
+            if x == num - 1:
+                break
+        else:
             return False
-        for i in range(3, int(math.sqrt(num)) + 1, 2):
-            if num % i == 0:
-                return False
-        return True
-
-    num = random.randint(min_val, max_val)
-    while not is_prime(num):
-        num = random.randint(min_val, max_val)
-    return num
+    return True
 
 
 def generate_random_percentage() -> float:
@@ -587,7 +1008,7 @@ def generate_random_percentage() -> float:
     Returns:
         float: A randomly generated percentage.
     """
-    return random.uniform(0.0, 100.0)
+    return _UNIFORM(0.0, 100.0)
 
 
 def generate_random_from_set(s: List[int]) -> int:
@@ -600,7 +1021,7 @@ def generate_random_from_set(s: List[int]) -> int:
     Returns:
         int: A randomly selected integer from the given set.
     """
-    return random.choice(s)
+    return _CHOICE(s)
 
 
 def generate_random_even(min_val: int, max_val: int) -> int:
@@ -613,11 +1034,16 @@ def generate_random_even(min_val: int, max_val: int) -> int:
 
     Returns:
         int: A randomly generated even integer between min_val and max_val.
+
+    Raises:
+        ValueError: If the range contains no even integer.
     """
-    num = random.randint(min_val, max_val)
-    if num % 2 != 0:
-        num += 1
-    return num
+    # Draw k uniformly so that 2k covers exactly the even values in range
+    lo = (min_val + 1) // 2
+    hi = max_val // 2
+    if lo > hi:
+        raise ValueError("Range contains no even integer.")
+    return 2 * _RANDINT(lo, hi)
 
 
 def generate_random_odd(min_val: int, max_val: int) -> int:
@@ -630,11 +1056,16 @@ def generate_random_odd(min_val: int, max_val: int) -> int:
 
     Returns:
         int: A randomly generated odd integer between min_val and max_val.
+
+    Raises:
+        ValueError: If the range contains no odd integer.
     """
-    num = random.randint(min_val, max_val)
-    if num % 2 == 0:
-        num += 1
-    return num
+    # Draw k uniformly so that 2k + 1 covers exactly the odd values in range
+    lo = min_val // 2
+    hi = (max_val - 1) // 2
+    if lo > hi:
+        raise ValueError("Range contains no odd integer.")
+    return 2 * _RANDINT(lo, hi) + 1
 
 
 def generate_unique_random_sequence(
@@ -653,9 +1084,9 @@ def generate_unique_random_sequence(
     """
     if length > (max_val - min_val + 1):
         raise ValueError("Sequence length exceeds the range size.")
-    numbers = list(range(min_val, max_val + 1))
-    random.shuffle(numbers)
-    return numbers[:length]
+    # Sampling from a lazy range only touches `length` positions, so the cost no longer
+    # grows with the width of the range.
+    return _SAMPLE(range(min_val, max_val + 1), length)
 
 
 def generate_random_exponential(lambda_val: float) -> float:
@@ -668,7 +1099,21 @@ def generate_random_exponential(lambda_val: float) -> float:
     Returns:
         float: A randomly generated value based on the exponential distribution.
     """
-    return -math.log(1 - random.random()) / lambda_val
+    return _EXPOVARIATE(lambda_val)
+
+
+def generate_random_exponentials(lambda_val: float, n: int) -> np.ndarray:
+    """
+    Generates a batch of random values based on an exponential distribution in a single vectorized draw.
+
+    Args:
+        lambda_val (float): The rate parameter of the distribution.
+        n (int): The number of values to generate.
+
+    Returns:
+        np.ndarray: An array of n randomly generated values based on the exponential distribution.
+    """
+    return _RNG.exponential(1.0 / lambda_val, size=n)
 
 
 def generate_random_complex_number(
@@ -686,14 +1131,40 @@ def generate_random_complex_number(
     Returns:
         ComplexNumber: A randomly generated complex number.
     """
-    real_part = random.uniform(real_min, real_max)
-    imaginary_part = random.uniform(imaginary_min, imaginary_max)
+    real_part = _UNIFORM(real_min, real_max)
+    imaginary_part = _UNIFORM(imaginary_min, imaginary_max)
     return ComplexNumber(real_part, imaginary_part)
 
 
+def generate_random_complex_numbers(
+    n: int,
+    real_min: float,
+    real_max: float,
+    imaginary_min: float,
+    imaginary_max: float,
+) -> ComplexNumberArray:
+    """
+    Generates a batch of random complex numbers with real and imaginary parts within specified ranges.
+
+    Args:
+        n (int): The number of complex numbers to generate.
+        real_min (float): The minimum value for the real parts.
+        real_max (float): The maximum value for the real parts.
+        imaginary_min (float): The minimum value for the imaginary parts.
+        imaginary_max (float): The maximum value for the imaginary parts.
+
+    Returns:
+        ComplexNumberArray: The randomly generated complex numbers, stored column-wise.
+    """
+    return ComplexNumberArray(
+        _RNG.uniform(real_min, real_max, n),
+        _RNG.uniform(imaginary_min, imaginary_max, n),
+    )
+
+
 def is_numeric(s: str) -> bool:
     """
-    Checks if a string is numeric.
+    Checks if a string is numeric, i.e. made only of the ASCII digits 0-9.
 
     Args:
         s (str): The string to check.
@@ -701,4 +1172,5 @@ def is_numeric(s: str) -> bool:
     Returns:
         bool: True if the string is numeric, False otherwise.
     """
-    return s.isdigit()
+    # isdigit() alone also accepts characters such as superscripts and other scripts' digits
+    return s.isascii() and s.isdecimal()
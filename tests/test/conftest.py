@@ -0,0 +1,10 @@
+import os
+import sys
+
+# The packages import each other as top-level modules (e.g. qaNexusDataGeneration.utils),
+# so the src directory has to be importable.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+# Legacy smoke script: it imports a module that does not exist (src.index) and runs at
+# import time, so it cannot be collected.
+collect_ignore = ["data_generator_test.py"]
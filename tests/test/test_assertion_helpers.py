@@ -0,0 +1,335 @@
+import math
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from qaNexusAssertion.utils import assertion_helpers
+from qaNexusAssertion.utils.assertion_exception import AssertionException
+
+
+_SRC = os.path.join(os.path.dirname(__file__), "..", "..", "src")
+
+
+def _run_python(code, *flags, **env):
+    environ = {key: value for key, value in os.environ.items() if key not in ("NO_COLOR", "QANEXUS_DISABLE_ASSERTIONS")}
+    environ.update(env, PYTHONPATH=_SRC)
+    return subprocess.run([sys.executable, *flags, "-c", code], env=environ, capture_output=True, text=True)
+
+
+class _Record:
+    def __init__(self):
+        self.name = "qa"
+        self.empty = None
+
+
+_TTY_STDERR = """
+import sys
+
+
+class _Tty:
+    def isatty(self):
+        return True
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+sys.stderr = _Tty()
+from qaNexusAssertion.utils.assertion_exception import AssertionException
+print(ascii(str(AssertionException("boom"))))
+"""
+
+
+@pytest.mark.parametrize(
+    "code, env, expected",
+    [
+        (_TTY_STDERR, {}, "'\\x1b[31mboom\\x1b[0m'"),
+        (_TTY_STDERR, {"NO_COLOR": "1"}, "'boom'"),
+        (_TTY_STDERR.replace("return True", "return False"), {}, "'boom'"),
+    ],
+    ids=["terminal", "no-color", "not-a-terminal"],
+)
+def test_assertion_exception_colors_only_on_a_terminal(code, env, expected):
+    result = _run_python(code, **env)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == expected
+
+
+def test_number_and_empty_object_type_checks():
+    for value in (1, 1.5, 1j):
+        assertion_helpers.assert_is_number(value, "number")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_is_number("1", "number")
+    assertion_helpers.assert_is_not_number("1", "number")
+    assertion_helpers.assert_object_is_empty({}, "empty")
+    assertion_helpers.assert_object_is_empty(0, "empty")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_object_is_empty([1], "empty")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_object_is_not_empty("", "not empty")
+
+
+def test_url_and_email_assertions():
+    assertion_helpers.assert_valid_url("https://example.com/path", "url")
+    assertion_helpers.assert_valid_email("qa.user@example.com", "email")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_valid_url("ftp://example.com", "url")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_valid_email("qa.user@example", "email")
+
+
+def test_regex_assertions():
+    assertion_helpers.assert_string_matches_regex("abc123", r"[a-z]+\d+", "regex")
+    assertion_helpers.assert_string_not_matches_regex("abc", r"\d+", "regex")
+    assertion_helpers.assert_string_matches_pattern("abc123", r"[a-z]+", "regex")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_string_matches_regex("abc", r"\d+", "regex")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_string_not_matches_regex("123", r"\d+", "regex")
+
+
+def test_regex_assertions_follow_re_semantics():
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_string_matches_pattern("abc\n", r"abc\Z", "regex")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_string_matches_regex("a{,2}", "a{,2}", "regex")
+    with pytest.raises(re.error):
+        assertion_helpers.assert_string_not_matches_regex("x", r"\x", "regex")
+
+
+def test_assert_disjoint():
+    assertion_helpers.assert_disjoint([1, 2], (3, 4), "disjoint")
+    with pytest.raises(AssertionException, match="common element"):
+        assertion_helpers.assert_disjoint({1, 2}, [2, 3], "disjoint")
+
+
+def test_set_assertions():
+    assertion_helpers.assert_subset_of([1, 2], {1, 2, 3}, "subset")
+    assertion_helpers.assert_subset_of({1}, [1, 2], "subset")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_subset_of([4], {1, 2}, "subset")
+    assertion_helpers.assert_collections_same_members([1, 2, 2], {2, 1}, "members")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_collection_not_same_members([1, 2], (2, 1), "members")
+
+
+@pytest.mark.parametrize(
+    "date, date_format",
+    [
+        ("2024-02-29", "%Y-%m-%d"),
+        ("29/02/2000", "%d/%m/%Y"),
+        ("2024-1-5", "%Y-%m-%d"),
+        ("23:59:59", "%H:%M:%S"),
+        ("24-12-31", "%y-%m-%d"),
+        ("2024-Feb-29", "%Y-%b-%d"),
+    ],
+)
+def test_assert_date_format_accepts_valid_dates(date, date_format):
+    assertion_helpers.assert_date_format(date, date_format, "date")
+
+
+@pytest.mark.parametrize(
+    "date, date_format",
+    [
+        ("2023-02-29", "%Y-%m-%d"),
+        ("2024-04-31", "%Y-%m-%d"),
+        ("1900-02-29", "%Y-%m-%d"),
+        ("2024-13-01", "%Y-%m-%d"),
+        ("2024-01-01 ", "%Y-%m-%d"),
+        ("24:00:00", "%H:%M:%S"),
+        ("2024/01/01", "%Y-%m-%d"),
+        ("2023-Feb-29", "%Y-%b-%d"),
+    ],
+)
+def test_assert_date_format_rejects_invalid_dates(date, date_format):
+    with pytest.raises(AssertionException) as raised:
+        assertion_helpers.assert_date_format(date, date_format, "date")
+    # No chained ValueError from strptime in the traceback
+    assert raised.value.__context__ is None or raised.value.__suppress_context__
+
+
+def test_equality_assertions_short_circuit_on_identity():
+    class NeverEqual:
+        def __eq__(self, other):
+            return False
+
+    value = NeverEqual()
+    assertion_helpers.assert_equals(value, value, "equals")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_not_equals(value, value, "not equals")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_equals(1, 2, "equals")
+
+
+def test_equality_failure_messages():
+    with pytest.raises(AssertionException, match="equals Expected: 1, but was: 2"):
+        assertion_helpers.assert_equals(1, 2, "equals")
+    with pytest.raises(AssertionException, match="Expected objects to be different, but both were: 1"):
+        assertion_helpers.assert_not_equals(1, 1, "not equals")
+
+
+def test_lazy_message_is_only_built_on_failure():
+    calls = []
+
+    def message():
+        calls.append(1)
+        return "lazy"
+
+    assertion_helpers.assert_is_null(None, message)
+    assert calls == []
+    with pytest.raises(AssertionException, match="lazy"):
+        assertion_helpers.assert_is_null(1, message)
+
+
+_FAILING_ASSERTION = (
+    "from qaNexusAssertion.utils import assertion_helpers\n"
+    "assertion_helpers.assert_is_null(1, 'not null')\n"
+)
+
+
+def test_assertions_still_run_under_optimize_flag_by_default():
+    result = _run_python(_FAILING_ASSERTION, "-O")
+    assert result.returncode != 0
+    assert "AssertionException" in result.stderr
+
+
+def test_assertions_are_disabled_under_optimize_flag_when_opted_in():
+    assert _run_python(_FAILING_ASSERTION, "-O", QANEXUS_DISABLE_ASSERTIONS="1").returncode == 0
+    # The opt-in has no effect without -O
+    assert _run_python(_FAILING_ASSERTION, QANEXUS_DISABLE_ASSERTIONS="1").returncode != 0
+
+
+def test_assert_object_has_keys_reports_missing_keys_in_order():
+    assertion_helpers.assert_object_has_keys({"a": 1, "b": 2}, ["a", "b"], "keys")
+    with pytest.raises(AssertionException, match="missing key\\(s\\): d, c"):
+        assertion_helpers.assert_object_has_keys({"a": 1}, ["d", "a", "c"], "keys")
+
+
+def test_nested_include_assertions():
+    collection = [1, [2, 3], ("x", "y")]
+    assertion_helpers.assert_nested_include(collection, 3, "nested")
+    assertion_helpers.assert_nested_include(collection, "y", "nested")
+    assertion_helpers.assert_not_nested_include(collection, 1, "nested")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_nested_include(collection, 4, "nested")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_not_nested_include(collection, 2, "nested")
+
+
+def test_assert_has_property_value_fails_on_missing_dict_key():
+    assertion_helpers.assert_has_property_value({"a": None}, "a", None, "dict")
+    with pytest.raises(AssertionException, match="does not have property: b"):
+        assertion_helpers.assert_has_property_value({"a": None}, "b", None, "dict")
+
+
+def test_assert_has_property_value_checks_attributes():
+    record = _Record()
+    assertion_helpers.assert_has_property_value(record, "empty", None, "object")
+    with pytest.raises(AssertionException, match="does not have property: missing"):
+        assertion_helpers.assert_has_property_value(record, "missing", None, "object")
+    with pytest.raises(AssertionException, match="Expected value for 'name'"):
+        assertion_helpers.assert_has_property_value(record, "name", "other", "object")
+
+
+def test_assert_odd_and_even():
+    assertion_helpers.assert_odd(3, "odd")
+    assertion_helpers.assert_odd(-3, "odd")
+    assertion_helpers.assert_even(-4, "even")
+    assertion_helpers.assert_even(0, "even")
+
+
+def test_assert_odd_and_even_accept_integral_floats():
+    assertion_helpers.assert_odd(3.0, "odd")
+    assertion_helpers.assert_even(4.0, "even")
+
+
+@pytest.mark.parametrize(
+    "assertion, value",
+    [("assert_odd", 2), ("assert_odd", 3.5), ("assert_even", 3), ("assert_even", 2.5)],
+)
+def test_assert_odd_and_even_fail(assertion, value):
+    with pytest.raises(AssertionException):
+        getattr(assertion_helpers, assertion)(value, "parity")
+
+
+def test_assert_is_null_or_undefined():
+    assertion_helpers.assert_is_null_or_undefined(None, "null")
+    with pytest.raises(AssertionException, match="null"):
+        assertion_helpers.assert_is_null_or_undefined(0, "null")
+
+
+def test_assert_is_null_or_undefined_keeps_its_own_name_and_docstring():
+    assert assertion_helpers.assert_is_null_or_undefined.__name__ == "assert_is_null_or_undefined"
+    assert "null or undefined" in assertion_helpers.assert_is_null_or_undefined.__doc__
+
+
+def test_string_prefix_and_suffix_assertions():
+    assertion_helpers.assert_string_starts_with("abc", "a", "str")
+    assertion_helpers.assert_string_ends_with("abc", "bc", "str")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_string_starts_with("abc", "b", "str")
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_string_ends_with("abc", "b", "str")
+
+
+def test_string_prefix_and_suffix_assertions_accept_bytes():
+    assertion_helpers.assert_string_starts_with(b"abc", b"a", "bytes")
+    assertion_helpers.assert_string_ends_with(b"abc", b"c", "bytes")
+
+
+def test_assert_empty_object():
+    for value in ({}, [], "", (), set(), b"", range(0)):
+        assertion_helpers.assert_empty_object(value, "empty")
+    for value in ({"a": 1}, [1], "a", range(1), None):
+        with pytest.raises(AssertionException):
+            assertion_helpers.assert_empty_object(value, "empty")
+
+
+def test_set_inputs_are_reused_as_is():
+    values = {1, 2}
+    frozen = frozenset(values)
+    assert assertion_helpers._as_set(values) is values
+    assert assertion_helpers._as_set(frozen) is frozen
+    assert assertion_helpers._as_set([1, 2, 2]) == values
+
+
+def test_assert_string_starts_with_any():
+    assertion_helpers.assert_string_starts_with_any("https://qa", ["http://", "https://"], "scheme")
+    assertion_helpers.assert_string_starts_with_any("abc", ("x", "a"), "prefix")
+    with pytest.raises(AssertionException, match="does not start with any of"):
+        assertion_helpers.assert_string_starts_with_any("ftp://qa", ["http://", "https://"], "scheme")
+
+
+def test_assert_string_starts_with_any_accepts_generators_and_bytes():
+    assertion_helpers.assert_string_starts_with_any(b"abc", [b"x", b"a"], "bytes")
+    with pytest.raises(AssertionException, match="any of: 'x', 'y'"):
+        assertion_helpers.assert_string_starts_with_any("abc", (p for p in ["x", "y"]), "generator")
+    with pytest.raises(AssertionException, match="any of: b'x'"):
+        assertion_helpers.assert_string_starts_with_any(b"abc", [b"x"], "bytes")
+
+
+def test_assert_close_to_within_delta():
+    assertion_helpers.assert_close_to(1.0, 1.05, 0.1, "close")
+    assertion_helpers.assert_close_to(1 + 1j, 1 + 1.05j, 0.1, "close")
+
+
+@pytest.mark.parametrize(
+    "actual, expected, delta",
+    [
+        (1.0, 2.0, 0.5),
+        (math.nan, 1.0, 1.0),
+        (1.0, math.nan, 1.0),
+        (complex(math.nan, 0), 1, 1.0),
+        (1 + 1j, 2j, 0.1),
+        (1.0, 1.0, -0.1),
+    ],
+)
+def test_assert_close_to_fails(actual, expected, delta):
+    with pytest.raises(AssertionException):
+        assertion_helpers.assert_close_to(actual, expected, delta, "close")
@@ -0,0 +1,455 @@
+import calendar
+import random
+import re
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from qaNexusDataGeneration.enums.CountryCodePhoneNumberPatternEnums import (
+    CountryCodePhoneNumberPatternEnums,
+)
+from qaNexusDataGeneration.enums.SupportedDateFormatsEnums import (
+    SupportedDateFormatsEnums,
+)
+from qaNexusDataGeneration.model.ComplexNumberArrayModel import ComplexNumberArray
+from qaNexusDataGeneration.model.ComplexNumberModel import ComplexNumber
+from qaNexusDataGeneration.statictVariables.DataGeneratorConstants import Constants
+from qaNexusDataGeneration.utils import data_generator
+
+
+# strptime equivalents of the supported date formats
+_STRPTIME_FORMATS = {
+    "yyyy-MM-dd": "%Y-%m-%d",
+    "yyyy/MM/dd": "%Y/%m/%d",
+    "yyyy-MMM-dd": "%Y-%b-%d",
+    "yyyy/MMM/dd": "%Y/%b/%d",
+    "dd-MM-yyyy": "%d-%m-%Y",
+    "dd-MMM-yyyy": "%d-%b-%Y",
+    "dd/MMM/yyyy": "%d/%b/%Y",
+}
+
+
+def _reference_luhn_checksum(number):
+    # The original digit-by-digit implementation
+    sum_ = 0
+    alternate = False
+    for i in range(len(number) - 1, -1, -1):
+        n = int(number[i])
+        if alternate:
+            n *= 2
+            if n > 9:
+                n -= 9
+        sum_ += n
+        alternate = not alternate
+    return (10 - (sum_ % 10)) % 10
+
+
+def _assert_follows_random_seed(generator):
+    random.seed(1)
+    first = [generator() for _ in range(5)]
+    random.seed(1)
+    assert [generator() for _ in range(5)] == first
+
+
+@pytest.mark.parametrize(
+    "country_code", list(CountryCodePhoneNumberPatternEnums.__members__)
+)
+def test_generate_phone_number_matches_country_pattern(country_code):
+    pattern = re.compile(CountryCodePhoneNumberPatternEnums[country_code].value)
+    for _ in range(50):
+        assert pattern.fullmatch(data_generator.generate_phone_number(country_code))
+
+
+def test_generate_phone_number_rejects_unknown_country():
+    with pytest.raises(ValueError) as raised:
+        data_generator.generate_phone_number("XX")
+    assert raised.value.__context__ is None
+
+
+def test_generate_random_phone_number_expands_pattern():
+    pattern = r"\+1 \(\d{3}\) [0-9]{3}-(\d\d)\d{2}"
+    for _ in range(50):
+        assert re.fullmatch(pattern, data_generator.generate_random_phone_number(pattern))
+
+
+@pytest.mark.parametrize("pattern", [r"\d+", r"\d{2,4}", r"[a-z]", r"a|b"])
+def test_generate_random_phone_number_rejects_unsupported_constructs(pattern):
+    with pytest.raises(ValueError):
+        data_generator.generate_random_phone_number(pattern)
+
+
+def test_generate_random_phone_number_keeps_literal_braces():
+    assert re.fullmatch(r"\{\d\} \d{2}", data_generator.generate_random_phone_number(r"\{\d\} \d{2}"))
+
+
+def test_generate_random_phone_number_parses_each_pattern_once(monkeypatch):
+    parsed = []
+    parse = data_generator.sre_parse.parse
+
+    def counting_parse(pattern, *args, **kwargs):
+        parsed.append(pattern)
+        return parse(pattern, *args, **kwargs)
+
+    monkeypatch.setattr(data_generator.sre_parse, "parse", counting_parse)
+    pattern = r"\d{3}-\d{4} x\d{2}"
+    for _ in range(10):
+        data_generator.generate_random_phone_number(pattern)
+    assert parsed.count(pattern) == 1
+
+
+@pytest.mark.parametrize("date_format", list(SupportedDateFormatsEnums))
+def test_generate_date_produces_valid_dates(date_format):
+    strptime_format = _STRPTIME_FORMATS[date_format.value]
+    for _ in range(2000):
+        # Raises ValueError for impossible days such as Sep-31 or Feb-30
+        parsed = datetime.strptime(data_generator.generate_date(date_format), strptime_format)
+        assert 1900 <= parsed.year <= datetime.now().year
+
+
+def test_generate_date_accepts_plain_string_formats():
+    for _ in range(2000):
+        datetime.strptime(data_generator.generate_date("dd.MMM.yyyy"), "%d.%b.%Y")
+
+
+def test_generate_date_zero_pads_month_and_day():
+    for _ in range(500):
+        assert re.fullmatch(r"\d{2}-\d{2}", data_generator.generate_date("MM-dd"))
+
+
+def test_generate_date_keeps_literal_braces():
+    assert re.fullmatch(r"\{x\} \d{2}", data_generator.generate_date("{x} dd"))
+
+
+@pytest.mark.parametrize("date_format", list(SupportedDateFormatsEnums))
+def test_enum_and_string_date_formats_compile_alike(date_format):
+    assert data_generator._compile_date_format(date_format) == data_generator._compile_date_format(date_format.value)
+
+
+def test_generate_date_caches_string_formats_in_a_bounded_cache():
+    size = len(data_generator._DATE_FORMAT_INFO)
+    for i in range(300):
+        data_generator.generate_date(f"dd/MM/yyyy #{i}")
+    assert len(data_generator._DATE_FORMAT_INFO) == size
+    assert data_generator._compile_date_format.cache_info().currsize <= 128
+
+
+def test_generate_date_day_distribution_is_uniform():
+    counts = {}
+    for _ in range(62000):
+        day = data_generator.generate_date("dd")
+        counts[day] = counts.get(day, 0) + 1
+    assert len(counts) == 31
+    # The old 8-bit draw made days 01-08 about 12% more likely than days 09-31
+    low = sum(counts[f"{day:02d}"] for day in range(1, 9)) / 8
+    high = sum(counts[f"{day:02d}"] for day in range(9, 32)) / 23
+    assert abs(low / high - 1) < 0.05
+
+
+def test_thread_random_is_local_to_each_thread():
+    assert data_generator._thread_random() is data_generator._thread_random()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(data_generator._thread_random()))
+    thread.start()
+    thread.join()
+    assert other[0] is not data_generator._thread_random()
+
+
+def test_generate_date_does_not_build_a_random_instance_per_call(monkeypatch):
+    data_generator._thread_random()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("generate_date built a new random.Random")
+
+    monkeypatch.setattr(random, "Random", fail)
+    for _ in range(100):
+        data_generator.generate_date()
+
+
+def test_supported_date_formats_expose_date_parts():
+    date_format = SupportedDateFormatsEnums.DD_MMM_YYYY
+    assert date_format.has_year and date_format.has_month_abbreviation and date_format.has_day
+    assert not date_format.has_month_number
+    date_format = SupportedDateFormatsEnums.YYYY_MM_DD
+    assert date_format.has_month_number and not date_format.has_month_abbreviation
+
+
+def test_get_max_days_handles_leap_years():
+    assert data_generator.get_max_days(2, 2000) == 29
+    assert data_generator.get_max_days(2, 1900) == 28
+    assert data_generator.get_max_days(2, 2024) == 29
+    assert data_generator.get_max_days(2, 2023) == 28
+    assert data_generator.get_max_days(4, 2024) == 30
+
+
+@pytest.mark.parametrize("month", [0, 13])
+def test_get_max_days_rejects_invalid_months(month):
+    with pytest.raises(ValueError, match="Invalid month"):
+        data_generator.get_max_days(month, 2024)
+
+
+def test_get_max_days_matches_calendar():
+    for year in range(1600, 2401):
+        for month in range(1, 13):
+            assert data_generator.get_max_days(month, year) == calendar.monthrange(year, month)[1]
+
+
+def test_generate_string_uses_the_alphanumeric_alphabet():
+    for length in (0, 1, 10, 64):
+        value = data_generator.generate_string(length)
+        assert len(value) == length
+        assert set(value) <= set(Constants.ALPHA_NUM)
+
+
+def test_generate_strings_returns_n_strings_of_the_given_length():
+    values = data_generator.generate_strings(50, 12)
+    assert len(values) == 50
+    assert all(len(value) == 12 for value in values)
+    assert set("".join(values)) <= set(Constants.ALPHA_NUM)
+    assert data_generator.generate_strings(0) == []
+
+
+def test_generate_strings_fast_falls_back_without_numba(monkeypatch):
+    monkeypatch.setattr(data_generator._fast, "NUMBA_AVAILABLE", False)
+    values = data_generator.generate_strings_fast(20, 8)
+    assert len(values) == 20
+    assert all(len(value) == 8 for value in values)
+    assert set("".join(values)) <= set(Constants.ALPHA_NUM)
+
+
+def test_generate_strings_fast_kernel_matches_generate_strings():
+    pytest.importorskip("numba")
+    values = data_generator.generate_strings_fast(200, 16)
+    assert len(values) == 200
+    assert all(len(value) == 16 for value in values)
+    assert set("".join(values)) <= set(Constants.ALPHA_NUM)
+
+
+def test_generate_strings_fast_kernel_follows_random_seed():
+    pytest.importorskip("numba")
+    random.seed(7)
+    first = data_generator.generate_strings_fast(10, 8)
+    random.seed(7)
+    assert data_generator.generate_strings_fast(10, 8) == first
+
+
+def test_generate_emails_uses_the_domain():
+    emails = data_generator.generate_emails(30, "@qa.test", 6)
+    assert len(emails) == 30
+    assert all(re.fullmatch(r"[A-Za-z0-9-]{6}@qa\.test", email) for email in emails)
+
+
+def test_generate_ip_addresses_returns_valid_ipv4_addresses():
+    addresses = data_generator.generate_ip_addresses(100)
+    assert len(addresses) == 100
+    for address in addresses:
+        octets = address.split(".")
+        assert len(octets) == 4 and all(0 <= int(octet) <= 255 for octet in octets)
+
+
+def test_generate_ssn_format():
+    for ssn in [data_generator.generate_ssn()] + data_generator.generate_ssns(20):
+        assert re.fullmatch(r"\d{3}-\d{2}-\d{4}", ssn)
+
+
+def test_complex_number_uses_slots():
+    number = ComplexNumber(1.5, -2.0)
+    assert not hasattr(number, "__dict__")
+    assert (number.get_real(), number.get_imaginary()) == (1.5, -2.0)
+
+
+def test_generate_random_complex_numbers_stays_in_range():
+    numbers = data_generator.generate_random_complex_numbers(100, -1.0, 1.0, 5.0, 6.0)
+    assert len(numbers) == 100
+    assert np.all((-1.0 <= numbers.get_real()) & (numbers.get_real() <= 1.0))
+    assert np.all((5.0 <= numbers.get_imaginary()) & (numbers.get_imaginary() <= 6.0))
+
+
+def test_complex_number_array_indexing():
+    numbers = ComplexNumberArray(np.array([1.0, 2.0, 3.0]), np.array([-1.0, -2.0, -3.0]))
+    assert len(numbers) == 3
+    assert isinstance(numbers[1], ComplexNumber)
+    assert (numbers[1].get_real(), numbers[1].get_imaginary()) == (2.0, -2.0)
+    assert (numbers[-1].get_real(), numbers[-1].get_imaginary()) == (3.0, -3.0)
+
+
+def test_complex_number_array_slicing():
+    numbers = ComplexNumberArray(np.array([1.0, 2.0, 3.0]), np.array([-1.0, -2.0, -3.0]))
+    tail = numbers[1:]
+    assert isinstance(tail, ComplexNumberArray)
+    assert len(tail) == 2
+    assert tail.get_real().tolist() == [2.0, 3.0]
+    assert tail.get_imaginary().tolist() == [-2.0, -3.0]
+    assert len(numbers[::2]) == 2
+
+
+def test_generate_random_even_stays_in_range():
+    for min_val, max_val in [(1, 9), (-5, 5), (3, 4), (2, 2)]:
+        values = {data_generator.generate_random_even(min_val, max_val) for _ in range(500)}
+        assert values == {v for v in range(min_val, max_val + 1) if v % 2 == 0}
+
+
+def test_generate_random_odd_stays_in_range():
+    for min_val, max_val in [(0, 8), (-5, 5), (4, 5), (3, 3)]:
+        values = {data_generator.generate_random_odd(min_val, max_val) for _ in range(500)}
+        assert values == {v for v in range(min_val, max_val + 1) if v % 2 == 1}
+
+
+def test_generate_random_even_and_odd_reject_empty_ranges():
+    with pytest.raises(ValueError):
+        data_generator.generate_random_even(3, 3)
+    with pytest.raises(ValueError):
+        data_generator.generate_random_odd(4, 4)
+
+
+def test_generate_timestamp_is_recent_iso_timestamp():
+    now = datetime.now()
+    for _ in range(100):
+        timestamp = datetime.fromisoformat(data_generator.generate_timestamp())
+        assert now - timedelta(milliseconds=10**9, seconds=1) <= timestamp <= now + timedelta(seconds=1)
+
+
+def test_generate_timestamps_returns_n_iso_timestamps():
+    timestamps = data_generator.generate_timestamps(5)
+    assert len(timestamps) == 5
+    for timestamp in timestamps:
+        datetime.fromisoformat(timestamp)
+
+
+@pytest.mark.parametrize("version, factory", [("v3", uuid.uuid3), ("v5", uuid.uuid5)])
+def test_generate_uuid_name_based_versions(version, factory):
+    generated = data_generator.generate_uuid(version, name="example.com")
+    assert generated == str(factory(uuid.NAMESPACE_DNS, "example.com"))
+    random_name = uuid.UUID(data_generator.generate_uuid(version))
+    assert random_name.version == int(version[1])
+
+
+def test_generate_uuid_v4_sets_version_and_variant():
+    for _ in range(200):
+        generated = uuid.UUID(data_generator.generate_uuid("v4"))
+        assert generated.version == 4
+        assert generated.variant == uuid.RFC_4122
+
+
+def test_calculate_luhn_checksum_matches_reference():
+    for number in ["0", "7992739871", "4111111111111111", "12345678901234567890"]:
+        assert data_generator.calculate_luhn_checksum(number) == _reference_luhn_checksum(number)
+
+
+def test_generate_credit_card_number_has_luhn_checksum_digit():
+    number = data_generator.generate_credit_card_number()
+    assert len(number) == 16 and number.isdigit()
+    assert int(number[-1]) == data_generator.calculate_luhn_checksum(number[:-1])
+
+
+@pytest.mark.parametrize("number", ["12a4", "", "12 34", "١٢"])
+def test_calculate_luhn_checksum_rejects_non_digits(number):
+    with pytest.raises(ValueError):
+        data_generator.calculate_luhn_checksum(number)
+
+
+def test_generate_random_prime_returns_primes_in_range():
+    primes_below_100 = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97}
+    values = {data_generator.generate_random_prime(1, 100) for _ in range(2000)}
+    assert values == primes_below_100
+    assert data_generator._is_prime(2**61 - 1)
+    assert not data_generator._is_prime(3215031751)  # Strong pseudoprime to bases 2, 3, 5 and 7
+    with pytest.raises(ValueError):
+        data_generator.generate_random_prime(24, 28)
+
+
+def test_generate_unique_random_sequence_is_unique_and_in_range():
+    sequence = data_generator.generate_unique_random_sequence(0, 10**12, 50)
+    assert len(set(sequence)) == 50
+    assert all(0 <= value <= 10**12 for value in sequence)
+    with pytest.raises(ValueError):
+        data_generator.generate_unique_random_sequence(1, 3, 4)
+
+
+def test_generate_random_exponentials_returns_positive_values():
+    values = data_generator.generate_random_exponentials(2.0, 100000)
+    assert values.shape == (100000,)
+    assert np.all(values >= 0)
+    assert abs(values.mean() - 0.5) < 0.01
+
+
+def test_generate_random_with_custom_distribution_follows_probabilities():
+    samples = data_generator.generate_random_with_custom_distribution_batch([0.1, 0.0, 0.6, 0.3], 100000)
+    frequencies = np.bincount(samples, minlength=4) / samples.size
+    assert frequencies[1] == 0
+    assert np.allclose(frequencies, [0.1, 0.0, 0.6, 0.3], atol=0.01)
+    with pytest.raises(ValueError):
+        data_generator.generate_random_with_custom_distribution([0.5, 0.6])
+
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        lambda: data_generator.generate_int(0, 10**6),
+        lambda: data_generator.generate_float(0.0, 1.0),
+        lambda: data_generator.generate_gaussian(0.0, 1.0),
+        lambda: data_generator.generate_random_from_set([1, 2, 3, 4]),
+        lambda: data_generator.generate_random_exponential(1.5),
+        data_generator.generate_ip_address,
+    ],
+)
+def test_random_module_samplers_follow_random_seed(generator):
+    _assert_follows_random_seed(generator)
+
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        data_generator.generate_credit_card_number,
+        data_generator.generate_passport_number,
+        data_generator.generate_bank_account_number,
+        data_generator.generate_iban,
+        data_generator.generate_phone_number,
+    ],
+)
+def test_identifier_generators_follow_random_seed(generator):
+    _assert_follows_random_seed(generator)
+
+
+@pytest.mark.parametrize(
+    "generator",
+    [
+        data_generator.generate_mac_address,
+        data_generator.generate_hex_color,
+        lambda: data_generator.generate_hex(12),
+    ],
+)
+def test_hex_generators_follow_random_seed(generator):
+    _assert_follows_random_seed(generator)
+
+
+def test_generate_ssn_follows_random_seed():
+    _assert_follows_random_seed(data_generator.generate_ssn)
+
+
+def test_generate_random_prime_follows_random_seed():
+    _assert_follows_random_seed(lambda: data_generator.generate_random_prime(1, 1000))
+
+
+def test_custom_distribution_follows_numpy_seed():
+    probabilities = [0.2, 0.3, 0.5]
+    np.random.seed(1)
+    first = [data_generator.generate_random_with_custom_distribution(probabilities) for _ in range(20)]
+    np.random.seed(1)
+    assert [data_generator.generate_random_with_custom_distribution(probabilities) for _ in range(20)] == first
+
+
+def test_byte_generators_follow_seed_argument():
+    assert data_generator.generate_binary_data(8, seed=3) == data_generator.generate_binary_data(8, seed=3)
+    assert len(data_generator.generate_binary_data(8)) == 8
+    assert len(data_generator.generate_byte_array(8)) == 8
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("0123", True), ("", False), ("12a", False), ("²", False), ("١٢", False)],
+)
+def test_is_numeric_accepts_only_ascii_digits(value, expected):
+    assert data_generator.is_numeric(value) is expected